@@ -6,6 +6,7 @@ with automatic optimization through Cython-compiled extensions when available.
 
 The package automatically selects the best available implementation:
 - Cython: High-performance compiled extensions (10-100x faster)
+- Numba: JIT-compiled numeric mode when numba is installed
 - Python: Pure Python fallback for maximum compatibility
 
 Usage:
@@ -24,11 +25,18 @@ try:
 
     _implementation = "cython"
 except ImportError:
-    # Fallback to pure Python implementation
     from basex.modes import Mode
-    from basex.basex import BaseXEncoder, init, encode, decode
 
-    _implementation = "python"
+    try:
+        # JIT-compiled numeric mode without a build step
+        from basex._numba_impl import BaseXEncoder, init, encode, decode
+
+        _implementation = "numba"
+    except ImportError:
+        # Fallback to pure Python implementation
+        from basex.basex import BaseXEncoder, init, encode, decode
+
+        _implementation = "python"
 
 # Always import presets from the same location
 from basex.presets import b64, b32, b16, b58, b57, b56
@@ -4,15 +4,287 @@
 # cython: cdivision=True
 """basex - Blazing fast base encoding/decoding library (Cython version)."""
 
+import functools
+import math
+import sys
+
+from cpython.buffer cimport PyBUF_READ, PyBUF_SIMPLE, PyBuffer_Release, PyObject_GetBuffer
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize, PyBytes_GET_SIZE
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from cpython.memoryview cimport PyMemoryView_FromMemory
+from cpython.unicode cimport PyUnicode_1BYTE_DATA, PyUnicode_New
+from libc.math cimport ceil, log
+from libc.string cimport memcpy, memset
+from basex.constants import BASE64_ALPHABET
 from basex.modes import Mode
 from basex._version import __version__
 
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+
+cdef extern from *:
+    """
+    /* Quotient by an invariant divisor as (n * c) >> shift, which needs
+       the high half of a 64x64-bit product. Without a 128-bit type the
+       callers fall back to plain division. */
+    #if defined(__SIZEOF_INT128__)
+    #define BASEX_HAVE_MULDIV 1
+    static inline unsigned long long basex_muldiv(unsigned long long n,
+                                                  unsigned long long c,
+                                                  int shift) {
+        return (unsigned long long)(((unsigned __int128)n * c) >> shift);
+    }
+    #else
+    #define BASEX_HAVE_MULDIV 0
+    static inline unsigned long long basex_muldiv(unsigned long long n,
+                                                  unsigned long long c,
+                                                  int shift) {
+        (void)n; (void)c; (void)shift;
+        return 0;
+    }
+    #endif
+
+    /* The code units of a str stored one byte per character (PEP 393
+       latin-1 kind), or NULL for wider strs, whose payload the callers
+       copy through str.encode instead. */
+    static inline const unsigned char* basex_latin1_data(PyObject* s) {
+    #if PY_VERSION_HEX < 0x030C0000
+        if (PyUnicode_READY(s) < 0) {
+            PyErr_Clear();
+            return NULL;
+        }
+    #endif
+        if (PyUnicode_KIND(s) != PyUnicode_1BYTE_KIND)
+            return NULL;
+        return PyUnicode_1BYTE_DATA(s);
+    }
+    """
+    bint BASEX_HAVE_MULDIV
+    unsigned long long basex_muldiv(unsigned long long n, unsigned long long c, int shift) nogil
+    const unsigned char* basex_latin1_data(object s)
+    bint PyUnicode_IS_COMPACT_ASCII(object s)
+
+
+cdef extern from "_simd.h":
+    bint BASEX_HAVE_NEON
+    int basex_cpu_has_avx2()
+    int basex_cpu_has_avx512vbmi()
+    size_t basex_b64_encode_avx2(const unsigned char* src, size_t length,
+                                 const unsigned char* alpha, unsigned char* dst) nogil
+    size_t basex_b64_encode_vbmi(const unsigned char* src, size_t length,
+                                 const unsigned char* alpha, unsigned char* dst) nogil
+    size_t basex_b64_decode_vbmi(const unsigned char* src, size_t length,
+                                 const unsigned char* lut, unsigned char* dst) nogil
+    size_t basex_b64_encode_neon(const unsigned char* src, size_t length,
+                                 const unsigned char* alpha, unsigned char* dst) nogil
+    size_t basex_b64_decode_neon(const unsigned char* src, size_t length,
+                                 const unsigned char* lut, unsigned char* dst) nogil
+
+
+# Vector kernels are chosen once per process from the running CPU
+cdef bint _HAVE_AVX2 = basex_cpu_has_avx2()
+cdef bint _HAVE_AVX512VBMI = basex_cpu_has_avx512vbmi()
+
+
+def _find_mul_inverse(divisor, limit):
+    """Find (c, shift) with n // divisor == (n * c) >> shift for all n < limit.
+
+    Takes the smallest shift for which c = ceil(2**shift / divisor) keeps
+    the rounding error c * divisor - 2**shift within 2**shift / limit.
+    """
+    shift = 0
+    while True:
+        c = -(-(1 << shift) // divisor)
+        if (c * divisor - (1 << shift)) * limit <= 1 << shift:
+            return c, shift
+        shift += 1
+
+
+cdef double _LOG_256 = log(256)
+
+# Up to these input sizes numeric mode converts through native limbs,
+# which is quadratic; longer inputs take the big-int paths.
+cdef Py_ssize_t _LIMB_MAX_BYTES = 2048
+cdef Py_ssize_t _LIMB_MAX_SYMBOLS = 4096
+
+# pybase64 (SIMD libbase64) beats the loops below for the standard base64
+# alphabet once the per-call overhead is amortized, from about this size.
+cdef Py_ssize_t _NATIVE_MIN_LENGTH = 256
+
+# RFC 4648 inputs above this size are encoded with the GIL released
+cdef Py_ssize_t _NOGIL_MIN_LENGTH = 65536
+
+# Super-digits span two PyLong digits (60 bits on the usual 30-bit-digit
+# builds), capped so that one always fits in an unsigned long long.
+cdef int _CHUNK_BITS = min(2 * sys.int_info.bits_per_digit, 60)
+
+
+cdef int _pick_chunk_k(object base):
+    # Largest k with base**k within _CHUNK_BITS bits
+    cdef int chunk_k = 1
+    while base ** (chunk_k + 1) <= (<object>1) << _CHUNK_BITS:
+        chunk_k += 1
+    return chunk_k
+
+
+# Fixed-size base58 inputs (32-byte keys, 64-byte signatures) convert by
+# one matrix-vector product: each big-endian 32-bit input limb times its
+# precomputed row of digits in base 58**5, reduced only every few rows.
+cdef enum:
+    _B58_RADIX = 656356768  # 58 ** 5
+cdef unsigned int _B58_TABLE_32[8 * 9]
+cdef unsigned int _B58_TABLE_64[16 * 18]
+
+
+cdef void _fill_base58_table(unsigned int* table, int limbs, int digits):
+    # Row i holds 2**(32 * (limbs - 1 - i)) in base 58**5, least significant first
+    cdef int i, j
+    for i in range(limbs):
+        value = (<object>1) << (32 * (limbs - 1 - i))
+        for j in range(digits):
+            value, table[i * digits + j] = divmod(value, _B58_RADIX)
+
+
+_fill_base58_table(_B58_TABLE_32, 8, 9)
+_fill_base58_table(_B58_TABLE_64, 16, 18)
+
+
+cdef inline object _new_ascii(Py_ssize_t length, bint as_bytes):
+    # Uninitialized result for ASCII symbols: bytes, or a compact one-byte
+    # str, filled in place through _ascii_data()
+    if as_bytes:
+        return PyBytes_FromStringAndSize(NULL, length)
+    return PyUnicode_New(length, 127)
+
+
+cdef inline unsigned char* _ascii_data(object result, bint as_bytes):
+    if as_bytes:
+        return <unsigned char*>PyBytes_AS_STRING(result)
+    return <unsigned char*>PyUnicode_1BYTE_DATA(result)
+
+
+cdef inline object _ascii_copy(const unsigned char* buf, Py_ssize_t length, bint as_bytes):
+    # Copy ASCII symbols into a new result, without the validation pass
+    # that bytes.decode('ascii') makes over them
+    cdef object result = _new_ascii(length, as_bytes)
+    memcpy(_ascii_data(result, as_bytes), buf, length)
+    return result
+
+
+cdef Py_ssize_t _encode_rfc4648_groups(const unsigned char* src, Py_ssize_t length,
+                                       const unsigned char* alpha, const unsigned char* pairs,
+                                       int bits_per_char, unsigned char* out) noexcept nogil:
+    # Whole input groups of base64/32/16, the same loops as in
+    # _encode_rfc4648 writing alphabet bytes into out; base16 copies both
+    # symbols of a byte from the 512-byte pairs table at once. Returns the
+    # number of input bytes consumed; the bit window converts the rest.
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j = 0
+    cdef Py_ssize_t n = length
+    cdef Py_ssize_t done
+    cdef unsigned int b0, b1, b2, b3, b4
+
+    if bits_per_char == 6:
+        n -= n % 3
+        # Whole 24-byte blocks through the vector kernel, if any
+        done = 0
+        if _HAVE_AVX512VBMI:
+            done = basex_b64_encode_vbmi(src, length, alpha, out)
+        elif _HAVE_AVX2:
+            done = basex_b64_encode_avx2(src, length, alpha, out)
+        elif BASEX_HAVE_NEON:
+            done = basex_b64_encode_neon(src, length, alpha, out)
+        j = done // 3 * 4
+        for i in range(done, n, 3):
+            b0 = src[i]
+            b1 = src[i + 1]
+            b2 = src[i + 2]
+            out[j] = alpha[b0 >> 2]
+            out[j + 1] = alpha[((b0 & 0x03) << 4) | (b1 >> 4)]
+            out[j + 2] = alpha[((b1 & 0x0F) << 2) | (b2 >> 6)]
+            out[j + 3] = alpha[b2 & 0x3F]
+            j += 4
+    elif bits_per_char == 5:
+        n -= n % 5
+        for i in range(0, n, 5):
+            b0 = src[i]
+            b1 = src[i + 1]
+            b2 = src[i + 2]
+            b3 = src[i + 3]
+            b4 = src[i + 4]
+            out[j] = alpha[b0 >> 3]
+            out[j + 1] = alpha[((b0 & 0x07) << 2) | (b1 >> 6)]
+            out[j + 2] = alpha[(b1 >> 1) & 0x1F]
+            out[j + 3] = alpha[((b1 & 0x01) << 4) | (b2 >> 4)]
+            out[j + 4] = alpha[((b2 & 0x0F) << 1) | (b3 >> 7)]
+            out[j + 5] = alpha[(b3 >> 2) & 0x1F]
+            out[j + 6] = alpha[((b3 & 0x03) << 3) | (b4 >> 5)]
+            out[j + 7] = alpha[b4 & 0x1F]
+            j += 8
+    elif bits_per_char == 4:
+        for i in range(length):
+            memcpy(out + 2 * i, pairs + 2 * src[i], 2)
+    else:
+        n = 0
+    return n
+
+
+cdef inline bint _has_invalid_symbol(const unsigned char* lut, const unsigned char* src,
+                                     Py_ssize_t length):
+    # One pass that only accumulates, so the conversion loops after it run
+    # without a branch per symbol; callers re-scan to name the culprit.
+    cdef unsigned char err = 0
+    cdef Py_ssize_t i
+    for i in range(length):
+        err |= lut[src[i]] == 0xFF
+    return err
+
+
+cdef inline Py_ssize_t _leading_zero_count(const unsigned char* buf, Py_ssize_t length, unsigned char zero):
+    # Stops at the first other byte instead of copying like lstrip()
+    cdef Py_ssize_t i = 0
+    while i < length and buf[i] == zero:
+        i += 1
+    return i
+
 
 cdef class BaseXEncoder:
-    cdef public str alphabet
-    cdef public int base
-    cdef public object mode
+    cdef readonly str alphabet
+    cdef readonly int base
+    cdef readonly object mode
+    cdef bint _is_rfc4648
+    cdef bint _use_pybase64
     cdef dict _decode_map
+    cdef bint _is_pow2
+    cdef int _bits_per_char
+    cdef int _pad_multiple
+    cdef int _max_utf8_per_char
+    cdef int _utf8_first
+    cdef double _log_base
+    cdef tuple _alpha_tuple
+    cdef str _zero_str
+    cdef bytes _alpha_bytes
+    cdef bytes _hex_pair_table
+    cdef bytes _decode_lut
+    cdef bint _lut_eligible
+    cdef bint _base58_fixed
+    cdef int _chunk_k
+    cdef object _chunk_div
+    cdef bint _use_muldiv
+    cdef unsigned long long _div_c
+    cdef int _div_shift
+    cdef int _recursion_cutoff
+    cdef int _limb_k
+    cdef unsigned long long _limb_div
+    cdef int _limb_bits
+    cdef bint _limb_muldiv
+    cdef unsigned long long _limb_c
+    cdef int _limb_shift
+    cdef double _log2_base
+    cdef dict _pow_cache
 
     def __init__(self, object alphabet, mode: Mode = Mode.DEFAULT):
         # Type validation
@@ -27,33 +299,182 @@ cdef class BaseXEncoder:
         if len(alphabet) < 2:
             raise ValueError(f"Alphabet must contain at least 2 characters, got {len(alphabet)}")
 
-        # Duplicate character validation
-        if len(alphabet) != len(set(alphabet)):
-            raise ValueError("Alphabet contains duplicate characters")
+        # Duplicate character validation, folded into the one pass that also
+        # builds the decode map and the per-symbol size bounds. Latin-1
+        # symbols are tracked in a 256-bit set instead of probing the dict.
+        cdef dict decode_map = {}
+        cdef int max_utf8 = 1
+        cdef Py_UCS4 max_char = 0
+        cdef Py_UCS4 char
+        cdef Py_ssize_t idx = 0
+        cdef unsigned long long seen[4]
+        cdef unsigned long long bit
+        cdef unsigned int code
+        memset(seen, 0, sizeof(seen))
+        for char in <str>alphabet:
+            code = char
+            if code < 256:
+                bit = 1ULL << (code & 63)
+                if seen[code >> 6] & bit:
+                    raise ValueError("Alphabet contains duplicate characters")
+                seen[code >> 6] |= bit
+            elif char in decode_map:
+                raise ValueError("Alphabet contains duplicate characters")
+            decode_map[char] = idx
+            idx += 1
+            if char > max_char:
+                max_char = char
+                max_utf8 = len(chr(char).encode('utf-8'))
+
+        base = len(alphabet)
+        is_pow2 = base & (base - 1) == 0
+
+        # RFC4648 mode is bitwise and needs a power-of-2 alphabet
+        if mode == Mode.RFC4648 and not is_pow2:
+            raise ValueError(f"RFC4648 mode requires power-of-2 alphabet size, got {base}")
 
         self.alphabet = alphabet
-        self.base = len(alphabet)
+        self.base = base
         self.mode = mode
-        self._decode_map = {char: idx for idx, char in enumerate(alphabet)}
+
+        # Mode dispatch on every call tests a bool instead of comparing enums
+        self._is_rfc4648 = mode == Mode.RFC4648
+        self._use_pybase64 = (
+            pybase64 is not None and self._is_rfc4648 and alphabet == BASE64_ALPHABET
+        )
+
+        # Invariants of the alphabet, hoisted out of the per-call paths
+        self._is_pow2 = is_pow2
+        self._bits_per_char = base.bit_length() - 1 if is_pow2 else 0
+        if self._bits_per_char == 6:
+            self._pad_multiple = 4
+        elif self._bits_per_char == 5:
+            self._pad_multiple = 8
+        else:
+            self._pad_multiple = 0
+        self._max_utf8_per_char = max_utf8
+        self._log_base = math.log(base)
+        self._decode_map = decode_map
+        self._alpha_tuple = tuple(alphabet)
+        self._zero_str = alphabet[0]
+        self._utf8_first = len(self._zero_str.encode('utf-8'))
+
+        # ASCII alphabets write symbol bytes into a preallocated buffer and
+        # decode it once, instead of joining one str object per symbol.
+        self._alpha_bytes = alphabet.encode('ascii') if alphabet.isascii() else None
+
+        # Base16 encodes whole bytes, so one lookup yields both symbols
+        if mode == Mode.RFC4648 and base == 16 and self._alpha_bytes is not None:
+            self._hex_pair_table = b''.join(
+                (alphabet[i >> 4] + alphabet[i & 0x0F]).encode('ascii') for i in range(256)
+            )
+        else:
+            self._hex_pair_table = None
+
+        # The 256-entry decode table is only possible when every symbol is
+        # a single latin-1 byte; it is built on first decode (_get_decode_lut).
+        self._lut_eligible = base < 256 and max_char <= 0xFF
+        self._decode_lut = None
+
+        # Any ASCII base58 alphabet can print the fixed-size matrix results
+        self._base58_fixed = base == 58 and self._alpha_bytes is not None
+
+        # Numeric mode converts one "super-digit" per big-int division
+        chunk_k = _pick_chunk_k(base)
+        self._chunk_k = chunk_k
+        self._chunk_div = (<object>self.base) ** chunk_k
+
+        # Super-digits are below chunk_div, so splitting them into symbols
+        # can divide by the base with a multiply and a shift.
+        div_c, div_shift = _find_mul_inverse(base, self._chunk_div)
+        self._use_muldiv = BASEX_HAVE_MULDIV and div_c < 2 ** 64
+        if self._use_muldiv:
+            self._div_c = div_c
+            self._div_shift = div_shift
+
+        # Short inputs skip big ints: the number is kept as 32-bit limbs
+        # (bytes side) and as digits below 2**32 in base limb_div (symbol
+        # side), so each step is one 64-bit multiply-add.
+        limb_k = 1
+        while (<object>base) ** (limb_k + 1) < 1 << 32:
+            limb_k += 1
+        self._limb_k = limb_k
+        self._limb_div = (<object>base) ** limb_k
+        self._limb_bits = (<object>self._limb_div).bit_length() - 1
+        limb_c, limb_shift = _find_mul_inverse(self._limb_div, self._limb_div << 32)
+        self._limb_muldiv = BASEX_HAVE_MULDIV and limb_c < 2 ** 64
+        if self._limb_muldiv:
+            self._limb_c = limb_c
+            self._limb_shift = limb_shift
+
+        # Inputs longer than this many symbols are converted by recursive
+        # splitting; powers of the base used for the splits are memoized.
+        self._recursion_cutoff = 16 * chunk_k
+        self._log2_base = math.log2(self.base)
+        self._pow_cache = {}
 
     cpdef str encode(self, object data):
-        cdef bytes data_bytes
+        return self._encode_object(data, False)
 
-        # Type validation
-        if not isinstance(data, (str, bytes)):
-            raise TypeError(f"Data must be str or bytes, got {type(data).__name__}")
+    cpdef bytes encode_to_bytes(self, object data):
+        """Encode data and return the result as UTF-8 bytes.
 
+        Same as encode(data).encode('utf-8'), but ASCII alphabets write
+        the symbols straight into the bytes object, so no intermediate
+        str is built.
+        """
+        return self._encode_object(data, True)
+
+    cdef object _encode_object(self, object data, bint as_bytes):
+        cdef Py_buffer view
+
+        # The encoders read the input in place: the code units of an ASCII
+        # str (already its UTF-8 form), the bytes payload, or any other
+        # contiguous buffer. Other strs go through a temporary UTF-8 copy,
+        # since PyUnicode_AsUTF8AndSize would keep one attached to the
+        # caller's object for its lifetime.
         if isinstance(data, str):
-            data_bytes = data.encode('utf-8')
-        else:
-            data_bytes = data
+            if PyUnicode_IS_COMPACT_ASCII(data):
+                return self._encode_buffer(
+                    <const unsigned char*>PyUnicode_1BYTE_DATA(data), len(<str>data), as_bytes
+                )
+            data = (<str>data).encode('utf-8')
+        if isinstance(data, bytes):
+            return self._encode_buffer(
+                <const unsigned char*>PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data), as_bytes
+            )
+        try:
+            PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+        except TypeError:
+            raise TypeError(f"Data must be str or bytes, got {type(data).__name__}") from None
+        except BufferError:
+            # Non-contiguous buffers, such as strided memoryviews, are
+            # copied the way the pure Python encoder copies them
+            return self._encode_object(memoryview(data).tobytes(), as_bytes)
+        try:
+            return self._encode_buffer(<const unsigned char*>view.buf, view.len, as_bytes)
+        finally:
+            PyBuffer_Release(&view)
+
+    cdef object _encode_buffer(self, const unsigned char* src, Py_ssize_t length, bint as_bytes):
+        # Returns str, or UTF-8 bytes when as_bytes is set
+        cdef object memory
+        cdef str encoded
 
-        if not data_bytes:
-            return ""
+        if length == 0:
+            return b"" if as_bytes else ""
 
-        if self.mode == Mode.RFC4648:
-            return self._encode_rfc4648(data_bytes)
-        return self._encode_numeric(data_bytes)
+        if self._is_rfc4648:
+            if self._use_pybase64 and length >= _NATIVE_MIN_LENGTH:
+                memory = PyMemoryView_FromMemory(<char*>src, length, PyBUF_READ)
+                if as_bytes:
+                    return pybase64.b64encode(memory)
+                return pybase64.b64encode_as_string(memory)
+            if self._alpha_bytes is not None:
+                return self._encode_rfc4648_ascii(src, length, as_bytes)
+            encoded = self._encode_rfc4648(src, length)
+            return encoded.encode('utf-8') if as_bytes else encoded
+        return self._encode_numeric(src, length, as_bytes)
 
     cpdef bytes decode(self, object data):
         # Type validation
@@ -63,10 +484,31 @@ cdef class BaseXEncoder:
         if not data:
             return b""
 
-        if self.mode == Mode.RFC4648:
+        if self._is_rfc4648:
+            if self._use_pybase64 and len(data) >= _NATIVE_MIN_LENGTH:
+                # Only canonical padded input is accepted there, with the
+                # same result as below; the rest takes the generic path.
+                try:
+                    return pybase64.b64decode(data, validate=True)
+                except ValueError:
+                    pass
             return self._decode_rfc4648(data)
         return self._decode_numeric(data)
 
+    def encode_batch(self, object datas):
+        """Encode many inputs in one call.
+
+        The compiled encoder is already C-level per input, so this simply
+        encodes each item; it mirrors the pure Python batch API.
+
+        Args:
+            datas: Strings (UTF-8) or bytes-like objects to encode.
+
+        Returns:
+            List of encoded strings, in input order.
+        """
+        return [self.encode(data) for data in datas]
+
     cpdef int max_encoded_length(self, int bytes_count):
         """Calculate maximum encoded string length in UTF-8 bytes.
 
@@ -86,120 +528,635 @@ cdef class BaseXEncoder:
             >>> b32.max_encoded_length(1)  # "f" -> "MY======" (8 chars with padding)
             8
         """
-        import math
         cdef int bits_per_char, bits, chars, output_multiple
         cdef int max_chars
-        cdef int max_utf8_bytes_per_char
-        cdef int char_utf8_len
 
         if bytes_count == 0:
             return 0
 
-        if self.mode == Mode.RFC4648:
-            bits_per_char = int(math.log2(self.base))
+        if self._is_rfc4648:
+            bits_per_char = self._bits_per_char
             bits = bytes_count * 8
             chars = (bits + bits_per_char - 1) // bits_per_char  # ceil division
 
             # Add padding to output multiple
-            if bits_per_char == 6:
-                output_multiple = 4
-                chars = ((chars + output_multiple - 1) // output_multiple) * output_multiple
-            elif bits_per_char == 5:
-                output_multiple = 8
+            output_multiple = self._pad_multiple
+            if output_multiple:
                 chars = ((chars + output_multiple - 1) // output_multiple) * output_multiple
 
             # Calculate UTF-8 byte length
-            return len(self.alphabet[0].encode('utf-8')) * chars
+            return self._utf8_first * chars
         else:
             # Numeric mode: worst case is all 0xFF bytes
             # Maximum value is 256^bytes_count - 1
             # In base N: ceil(log_N(256^bytes_count)) = ceil(bytes_count * log_N(256))
-            if self.base == 1:
-                return bytes_count * 8  # Each bit needs a symbol
-            max_chars = <int>math.ceil(bytes_count * math.log(256) / math.log(self.base))
+            max_chars = <int>ceil(bytes_count * _LOG_256 / self._log_base)
             # Account for leading zeros
             max_chars += bytes_count
             # Calculate UTF-8 byte length (worst case: all symbols are max UTF-8 size)
-            # Cannot use generator expression in cpdef, use loop instead
-            max_utf8_bytes_per_char = 1
-            for c in self.alphabet:
-                char_utf8_len = len(c.encode('utf-8'))
-                if char_utf8_len > max_utf8_bytes_per_char:
-                    max_utf8_bytes_per_char = char_utf8_len
-            return max_chars * max_utf8_bytes_per_char
-
-    cdef str _encode_numeric(self, bytes data):
+            return max_chars * self._max_utf8_per_char
+
+    cdef object _encode_numeric(self, const unsigned char* src, Py_ssize_t length, bint as_bytes):
+        cdef object num
+        cdef double bit_length
+        cdef Py_ssize_t width
+        cdef Py_ssize_t leading_zeros
+        cdef str body
+
+        leading_zeros = _leading_zero_count(src, length, 0)
+        if self._base58_fixed and leading_zeros < length:
+            if length == 32:
+                return self._encode_base58_fixed(
+                    src, leading_zeros, _B58_TABLE_32, 8, 9, as_bytes
+                )
+            if length == 64:
+                return self._encode_base58_fixed(
+                    src, leading_zeros, _B58_TABLE_64, 16, 18, as_bytes
+                )
+        if (
+            self._alpha_bytes is not None
+            and 0 < length - leading_zeros <= _LIMB_MAX_BYTES
+        ):
+            return self._encode_numeric_limbs(
+                src + leading_zeros, length - leading_zeros, leading_zeros, as_bytes
+            )
+
         # Use Python int for arbitrary precision
-        cdef object num = int.from_bytes(data, 'big')
-        cdef int remainder
-        cdef int leading_zeros
-        cdef list result
+        num = int.from_bytes(PyMemoryView_FromMemory(<char*>src, length, PyBUF_READ), 'big')
 
         if num == 0:
-            return self.alphabet[0]
+            return self._zero_str.encode('utf-8') if as_bytes else self._zero_str
+
+        # Upper bound on the symbol count; surplus zeros are stripped below
+        bit_length = num.bit_length()
+        width = <Py_ssize_t>(bit_length / self._log2_base) + 2
+        if width > self._recursion_cutoff:
+            body = self._encode_numeric_recursive(num, width).lstrip(self._zero_str)
+        else:
+            body = self._encode_numeric_block(num)
+
+        body = self._zero_str * leading_zeros + body
+        return body.encode('utf-8') if as_bytes else body
+
+    cdef object _encode_base58_fixed(self, const unsigned char* src, Py_ssize_t leading_zeros,
+                                     const unsigned int* table, int limbs, int digits,
+                                     bint as_bytes):
+        # After a reduction every digit is below 58**5 < 2**30, so four more
+        # rows of products below 2**62 still fit in 64 bits.
+        cdef const unsigned char* alpha = self._alpha_bytes
+        cdef unsigned long long acc[18]
+        cdef unsigned long long limb, carry, rem
+        cdef unsigned char raw[90]
+        cdef int i, j, k, pos
+        cdef int size = digits * 5
+
+        for j in range(digits):
+            acc[j] = 0
+        for i in range(limbs):
+            limb = (
+                (<unsigned long long>src[4 * i] << 24)
+                | (<unsigned long long>src[4 * i + 1] << 16)
+                | (<unsigned long long>src[4 * i + 2] << 8)
+                | src[4 * i + 3]
+            )
+            for j in range(digits):
+                acc[j] += limb * table[i * digits + j]
+            if i % 4 == 3:
+                carry = 0
+                for j in range(digits):
+                    acc[j] += carry
+                    carry = acc[j] // _B58_RADIX
+                    acc[j] -= carry * _B58_RADIX
+
+        # Five symbols per digit, written from the end
+        pos = size
+        for j in range(digits):
+            rem = acc[j]
+            for k in range(5):
+                pos -= 1
+                raw[pos] = <unsigned char>(rem % 58)
+                rem //= 58
+
+        # Leading zero digits outnumber leading zero bytes, so backing up
+        # over the zero digits yields exactly one zero symbol per zero byte.
+        pos = 0
+        while raw[pos] == 0:
+            pos += 1
+        pos -= leading_zeros
+        for i in range(pos, size):
+            raw[i] = alpha[raw[i]]
+        return _ascii_copy(raw + pos, size - pos, as_bytes)
 
+    cdef object _encode_numeric_limbs(self, const unsigned char* src, Py_ssize_t length,
+                                      Py_ssize_t leading_zeros, bint as_bytes):
+        # Schoolbook conversion without big ints: the input (nonzero, after
+        # its leading zero bytes) is consumed four bytes at a time, a
+        # leading partial block first, and multiplied into little-endian
+        # digits in base limb_div. The result is allocated at its exact
+        # length and written in place.
+        cdef unsigned long long limb_div = self._limb_div
+        cdef unsigned long long limb_c = self._limb_c
+        cdef int limb_shift = self._limb_shift
+        cdef bint use_muldiv = self._limb_muldiv
+        cdef unsigned long long base = self.base
+        cdef unsigned long long div_c = self._div_c
+        cdef int div_shift = self._div_shift
+        cdef bint base_muldiv = self._use_muldiv
+        cdef int limb_k = self._limb_k
+        cdef const unsigned char* alpha = self._alpha_bytes
+        cdef Py_ssize_t capacity = (length * 8) // self._limb_bits + 2
+        cdef unsigned int* digits
+        cdef Py_ssize_t used = 0
+        cdef Py_ssize_t i = 0
+        cdef Py_ssize_t d
+        cdef int take, t, k, top
+        cdef unsigned long long mul, carry, cur, quot, rem
+        cdef Py_ssize_t size
+        cdef Py_ssize_t pos
+        cdef object result
+        cdef unsigned char* out
+
+        digits = <unsigned int*>PyMem_Malloc(capacity * sizeof(unsigned int))
+        if digits == NULL:
+            raise MemoryError()
+        try:
+            take = length % 4 or 4
+            while i < length:
+                carry = 0
+                for t in range(take):
+                    carry = (carry << 8) | src[i + t]
+                mul = 1ULL << (8 * take)
+                for d in range(used):
+                    cur = digits[d] * mul + carry
+                    if use_muldiv:
+                        quot = basex_muldiv(cur, limb_c, limb_shift)
+                    else:
+                        quot = cur // limb_div
+                    digits[d] = <unsigned int>(cur - quot * limb_div)
+                    carry = quot
+                while carry:
+                    quot = carry // limb_div
+                    digits[used] = <unsigned int>(carry - quot * limb_div)
+                    used += 1
+                    carry = quot
+                i += take
+                take = 4
+
+            # Every digit splits into limb_k symbols, written from the end,
+            # except the most significant one, which is not zero-padded
+            top = 0
+            rem = digits[used - 1]
+            while rem:
+                rem //= base
+                top += 1
+            size = leading_zeros + (used - 1) * limb_k + top
+            result = _new_ascii(size, as_bytes)
+            out = _ascii_data(result, as_bytes)
+            memset(out, alpha[0], leading_zeros)
+            pos = size
+            for d in range(used):
+                rem = digits[d]
+                for k in range(limb_k if d < used - 1 else top):
+                    if base_muldiv:
+                        quot = basex_muldiv(rem, div_c, div_shift)
+                    else:
+                        quot = rem // base
+                    pos -= 1
+                    out[pos] = alpha[rem - quot * base]
+                    rem = quot
+        finally:
+            PyMem_Free(digits)
+
+        return result
+
+    cdef str _encode_numeric_block(self, object num):
+        cdef object chunk
+        cdef unsigned long long rem
+        cdef unsigned long long quot
+        cdef unsigned long long base = self.base
+        cdef unsigned long long div_c = self._div_c
+        cdef int div_shift = self._div_shift
+        cdef bint use_muldiv = self._use_muldiv
+        cdef int chunk_k = self._chunk_k
+        cdef int k
+        cdef tuple alpha = self._alpha_tuple
+        cdef str zero
+        cdef list result
+
+        if self._alpha_bytes is not None:
+            return self._encode_numeric_block_ascii(num)
+
+        # One big-int division per super-digit, then native C division
         result = []
         while num > 0:
-            num, remainder = divmod(num, self.base)
-            result.append(self.alphabet[remainder])
+            num, chunk = divmod(num, self._chunk_div)
+            rem = chunk
+            for k in range(chunk_k):
+                if use_muldiv:
+                    quot = basex_muldiv(rem, div_c, div_shift)
+                else:
+                    quot = rem // base
+                result.append(alpha[rem - quot * base])
+                rem = quot
+
+        # The most significant super-digit was zero-padded to chunk_k symbols
+        zero = alpha[0]
+        while result and result[len(result) - 1] == zero:
+            result.pop()
+
+        return ''.join(reversed(result))
+
+    cdef str _encode_numeric_block_ascii(self, object num):
+        cdef object chunk
+        cdef unsigned long long rem
+        cdef unsigned long long quot
+        cdef unsigned long long base = self.base
+        cdef unsigned long long div_c = self._div_c
+        cdef int div_shift = self._div_shift
+        cdef bint use_muldiv = self._use_muldiv
+        cdef int chunk_k = self._chunk_k
+        cdef int k
+        cdef const unsigned char* alpha = self._alpha_bytes
+        cdef double bit_length = num.bit_length()
+        cdef Py_ssize_t size
+        cdef Py_ssize_t pos
+        cdef bytearray buf
+        cdef unsigned char* out
+
+        # Room for every super-digit, filled from the end backwards
+        size = ((<Py_ssize_t>(bit_length / self._log2_base) + 1) // chunk_k + 2) * chunk_k
+        buf = bytearray(size)
+        out = buf
+        pos = size
+
+        while num > 0:
+            num, chunk = divmod(num, self._chunk_div)
+            rem = chunk
+            for k in range(chunk_k):
+                if use_muldiv:
+                    quot = basex_muldiv(rem, div_c, div_shift)
+                else:
+                    quot = rem // base
+                pos -= 1
+                out[pos] = alpha[rem - quot * base]
+                rem = quot
+
+        # The most significant super-digit was zero-padded to chunk_k symbols
+        while pos < size and out[pos] == alpha[0]:
+            pos += 1
 
-        leading_zeros = len(data) - len(data.lstrip(b'\x00'))
-        return self.alphabet[0] * leading_zeros + ''.join(reversed(result))
+        return _ascii_copy(out + pos, size - pos, False)
+
+    cdef str _encode_numeric_recursive(self, object num, Py_ssize_t width):
+        # Split by a power of the base close to half the width, convert the
+        # halves independently and zero-pad each to its exact width.
+        cdef Py_ssize_t split
+        cdef object hi, lo
+
+        if width <= self._recursion_cutoff:
+            return self._encode_numeric_block(num).rjust(width, self._zero_str)
+
+        split = self._chunk_k
+        while split * 2 < width:
+            split *= 2
+        hi, lo = divmod(num, self._base_power(split))
+        return self._encode_numeric_recursive(hi, width - split) + self._encode_numeric_recursive(lo, split)
+
+    cdef inline bytes _get_decode_lut(self):
+        # 256-entry decode table indexed by code point, 0xFF marks symbols
+        # outside the alphabet. Built on first use so that encode-only
+        # instances never pay for it.
+        if self._decode_lut is None and self._lut_eligible:
+            self._decode_lut = bytes([self._decode_map.get(chr(c), 0xFF) for c in range(256)])
+        return self._decode_lut
 
     cdef bytes _decode_numeric(self, str data):
-        cdef int leading_zeros
+        cdef Py_ssize_t leading_zeros = 0
+        cdef Py_ssize_t length = len(data)
+        cdef str zero
         # Use Python int for arbitrary precision
-        cdef object num = 0
+        cdef object num
+        cdef bytes raw
+        cdef const unsigned char* src
         cdef int byte_length
-        cdef bytes result
 
-        for char in data:
-            if char not in self._decode_map:
-                raise ValueError(f"Invalid character: {char}")
-
-        leading_zeros = len(data) - len(data.lstrip(self.alphabet[0]))
-
-        for char in data:
-            num = num * self.base + self._decode_map[char]
+        if self._get_decode_lut() is not None:
+            # Symbols are read in place from one-byte strs
+            src = basex_latin1_data(data)
+            if src == NULL:
+                try:
+                    raw = data.encode('latin-1')
+                except UnicodeEncodeError:
+                    self._raise_invalid_character(data)
+                src = raw
+            if _has_invalid_symbol(self._decode_lut, src, length):
+                self._raise_invalid_character(data)
+            leading_zeros = _leading_zero_count(src, length, ord(self._zero_str))
+            if length <= _LIMB_MAX_SYMBOLS:
+                return self._decode_numeric_limbs(src, length, leading_zeros)
+            if length > self._recursion_cutoff:
+                num = self._decode_numeric_recursive_lut(src, length)
+            else:
+                num = self._decode_numeric_block_lut(src, length)
+        else:
+            for char in data:
+                if char not in self._decode_map:
+                    raise ValueError(f"Invalid character: {char}")
+            if len(data) > self._recursion_cutoff:
+                num = self._decode_numeric_recursive(data)
+            else:
+                num = self._decode_numeric_block(data)
+            zero = self._zero_str
+            if length and data[0] == zero:
+                leading_zeros = length - len(data.lstrip(zero))
 
         if num == 0:
             byte_length = 1
         else:
             byte_length = (num.bit_length() + 7) // 8
 
-        result = num.to_bytes(byte_length, 'big')
-        return b'\x00' * leading_zeros + result
+        # to_bytes() writes the leading zero bytes as well
+        return num.to_bytes(leading_zeros + byte_length, 'big')
+
+    cdef bytes _decode_numeric_limbs(self, const unsigned char* src, Py_ssize_t length,
+                                     Py_ssize_t leading_zeros):
+        # Symbols are folded limb_k at a time into a digit below 2**32 and
+        # multiplied into little-endian 32-bit limbs with one carry pass.
+        # Returns leading_zeros zero bytes followed by the minimal
+        # big-endian bytes (b"\x00" for zero), allocated at exact size.
+        # The symbols were validated by the caller.
+        cdef const unsigned char* lut = self._decode_lut
+        cdef unsigned long long base = self.base
+        cdef unsigned long long mul, carry, cur
+        cdef int limb_k = self._limb_k
+        cdef Py_ssize_t capacity = (length * (<object>self.base).bit_length()) // 32 + 2
+        cdef unsigned int* limbs
+        cdef Py_ssize_t used = 0
+        cdef Py_ssize_t i = 0
+        cdef Py_ssize_t l
+        cdef int take, t
+        cdef unsigned char value
+        cdef unsigned int limb
+        cdef int top
+        cdef Py_ssize_t size
+        cdef bytes result
+        cdef unsigned char* out
+        cdef Py_ssize_t pos
+
+        limbs = <unsigned int*>PyMem_Malloc(capacity * sizeof(unsigned int))
+        if limbs == NULL:
+            raise MemoryError()
+        try:
+            take = length % limb_k or limb_k
+            while i < length:
+                carry = 0
+                mul = 1
+                for t in range(take):
+                    carry = carry * base + lut[src[i + t]]
+                    mul *= base
+                for l in range(used):
+                    cur = limbs[l] * mul + carry
+                    limbs[l] = <unsigned int>cur
+                    carry = cur >> 32
+                if carry:
+                    limbs[used] = <unsigned int>carry
+                    used += 1
+                i += take
+                take = limb_k
+
+            # Bytes are written from the end; the top limb gives only its
+            # significant bytes and everything before is zero
+            top = 0
+            if used:
+                limb = limbs[used - 1]
+                while limb:
+                    limb >>= 8
+                    top += 1
+                size = leading_zeros + (used - 1) * 4 + top
+            else:
+                size = leading_zeros + 1
+            result = PyBytes_FromStringAndSize(NULL, size)
+            out = <unsigned char*>PyBytes_AS_STRING(result)
+            pos = size
+            for l in range(used):
+                limb = limbs[l]
+                for t in range(4 if l < used - 1 else top):
+                    pos -= 1
+                    out[pos] = limb & 0xFF
+                    limb >>= 8
+            memset(out, 0, pos)
+        finally:
+            PyMem_Free(limbs)
+
+        return result
+
+    cdef object _decode_numeric_block(self, str data):
+        cdef object num
+        cdef unsigned long long small
+        cdef unsigned long long base = self.base
+        cdef int chunk_k = self._chunk_k
+        cdef Py_ssize_t length = len(data)
+        cdef Py_ssize_t head
+        cdef Py_ssize_t i
+        cdef Py_ssize_t j
+        cdef dict decode_map = self._decode_map
+
+        # Leading partial chunk first so that the rest splits evenly
+        head = length % chunk_k
+        small = 0
+        for i in range(head):
+            small = small * base + <unsigned long long>decode_map[data[i]]
+        num = small
+        for i in range(head, length, chunk_k):
+            small = 0
+            for j in range(i, i + chunk_k):
+                small = small * base + <unsigned long long>decode_map[data[j]]
+            num = num * self._chunk_div + small
+        return num
+
+    cdef object _decode_numeric_recursive(self, str data):
+        # Horner's rule applied to halves: value(hi + lo) is
+        # value(hi) * base**len(lo) + value(lo).
+        cdef Py_ssize_t length = len(data)
+        cdef Py_ssize_t split
+        cdef object hi, lo
+
+        if length <= self._recursion_cutoff:
+            return self._decode_numeric_block(data)
+
+        split = self._chunk_k
+        while split * 2 < length:
+            split *= 2
+        hi = self._decode_numeric_recursive(data[:length - split])
+        lo = self._decode_numeric_recursive(data[length - split:])
+        return hi * self._base_power(split) + lo
+
+    cdef object _decode_numeric_block_lut(self, const unsigned char* src, Py_ssize_t length):
+        # Same folding as _decode_numeric_block, but symbols (validated by
+        # the caller) are mapped through the decode table.
+        cdef object num
+        cdef unsigned long long small
+        cdef unsigned long long base = self.base
+        cdef int chunk_k = self._chunk_k
+        cdef const unsigned char* lut = self._decode_lut
+        cdef unsigned char value
+        cdef Py_ssize_t head
+        cdef Py_ssize_t i
+        cdef Py_ssize_t j
 
-    cdef str _encode_rfc4648(self, bytes data):
-        import math
-        cdef int bits_per_char = int(math.log2(self.base))
-        cdef int padding_bits
-        cdef str bits
+        head = length % chunk_k
+        small = 0
+        for i in range(head):
+            small = small * base + lut[src[i]]
+        num = small
+        for i in range(head, length, chunk_k):
+            small = 0
+            for j in range(i, i + chunk_k):
+                small = small * base + lut[src[j]]
+            num = num * self._chunk_div + small
+        return num
+
+    cdef object _decode_numeric_recursive_lut(self, const unsigned char* src, Py_ssize_t length):
+        cdef Py_ssize_t split
+        cdef object hi, lo
+
+        if length <= self._recursion_cutoff:
+            return self._decode_numeric_block_lut(src, length)
+
+        split = self._chunk_k
+        while split * 2 < length:
+            split *= 2
+        hi = self._decode_numeric_recursive_lut(src, length - split)
+        lo = self._decode_numeric_recursive_lut(src + length - split, split)
+        return hi * self._base_power(split) + lo
+
+    cdef object _base_power(self, Py_ssize_t exponent):
+        # Split points are always chunk_k times a power of two, so the
+        # cache holds one entry per recursion level.
+        cdef object power = self._pow_cache.get(exponent)
+        if power is None:
+            power = (<object>self.base) ** exponent
+            self._pow_cache[exponent] = power
+        return power
+
+    cdef object _encode_rfc4648_ascii(self, const unsigned char* src, Py_ssize_t length,
+                                      bint as_bytes):
+        cdef int bits_per_char = self._bits_per_char
+        cdef const unsigned char* alpha = self._alpha_bytes
+        cdef const unsigned char* pairs = NULL
+        cdef Py_ssize_t size
+        cdef Py_ssize_t i
+        cdef Py_ssize_t j
+        cdef Py_ssize_t n
+        cdef unsigned long long acc = 0
+        cdef int nbits = 0
+        cdef unsigned long long mask = self.base - 1
+        cdef int output_multiple = self._pad_multiple
+        cdef object result
+        cdef unsigned char* out
+
+        # Exact output size including padding; the result is allocated
+        # once and filled in place, with no separate decode step
+        size = (length * 8 + bits_per_char - 1) // bits_per_char
+        if output_multiple > 0:
+            size = ((size + output_multiple - 1) // output_multiple) * output_multiple
+        result = _new_ascii(size, as_bytes)
+        out = _ascii_data(result, as_bytes)
+
+        if self._hex_pair_table is not None:
+            pairs = self._hex_pair_table
+
+        # Whole input groups, then the bit window for the tail. Large
+        # inputs convert without the GIL so that other threads keep running.
+        if length > _NOGIL_MIN_LENGTH:
+            with nogil:
+                n = _encode_rfc4648_groups(src, length, alpha, pairs, bits_per_char, out)
+        else:
+            n = _encode_rfc4648_groups(src, length, alpha, pairs, bits_per_char, out)
+        j = n * 8 // bits_per_char
+
+        for i in range(n, length):
+            acc = (acc << 8) | src[i]
+            nbits += 8
+            while nbits >= bits_per_char:
+                nbits -= bits_per_char
+                out[j] = alpha[(acc >> nbits) & mask]
+                j += 1
+            acc &= (1ULL << nbits) - 1
+        if nbits:
+            out[j] = alpha[(acc << (bits_per_char - nbits)) & mask]
+            j += 1
+
+        while j < size:
+            out[j] = ord('=')
+            j += 1
+
+        return result
+
+    cdef str _encode_rfc4648(self, const unsigned char* src, Py_ssize_t length):
+        cdef int bits_per_char = self._bits_per_char
+        cdef Py_ssize_t i
+        cdef Py_ssize_t n
+        cdef unsigned int b0, b1, b2, b3, b4
+        cdef unsigned long long acc = 0
+        cdef int nbits = 0
+        cdef unsigned long long mask = self.base - 1
+        cdef tuple alpha = self._alpha_tuple
         cdef list result
-        cdef int i
-        cdef str chunk
         cdef int output_multiple
         cdef int padding_chars
 
-        if 2 ** bits_per_char != self.base:
-            raise ValueError(f"RFC4648 mode requires power-of-2 alphabet size, got {self.base}")
-
-        bits = ''.join(f'{byte:08b}' for byte in data)
-        padding_bits = (bits_per_char - len(bits) % bits_per_char) % bits_per_char
-        bits += '0' * padding_bits
-
         result = []
-        for i in range(0, len(bits), bits_per_char):
-            chunk = bits[i:i + bits_per_char]
-            result.append(self.alphabet[int(chunk, 2)])
 
+        # Specialized loops for whole input groups of the standard bases;
+        # the remaining tail is handled by the generic bit window below.
+        n = length
         if bits_per_char == 6:
-            output_multiple = 4
+            n -= n % 3
+            for i in range(0, n, 3):
+                b0 = src[i]
+                b1 = src[i + 1]
+                b2 = src[i + 2]
+                result.append(alpha[b0 >> 2])
+                result.append(alpha[((b0 & 0x03) << 4) | (b1 >> 4)])
+                result.append(alpha[((b1 & 0x0F) << 2) | (b2 >> 6)])
+                result.append(alpha[b2 & 0x3F])
         elif bits_per_char == 5:
-            output_multiple = 8
+            n -= n % 5
+            for i in range(0, n, 5):
+                b0 = src[i]
+                b1 = src[i + 1]
+                b2 = src[i + 2]
+                b3 = src[i + 3]
+                b4 = src[i + 4]
+                result.append(alpha[b0 >> 3])
+                result.append(alpha[((b0 & 0x07) << 2) | (b1 >> 6)])
+                result.append(alpha[(b1 >> 1) & 0x1F])
+                result.append(alpha[((b1 & 0x01) << 4) | (b2 >> 4)])
+                result.append(alpha[((b2 & 0x0F) << 1) | (b3 >> 7)])
+                result.append(alpha[(b3 >> 2) & 0x1F])
+                result.append(alpha[((b3 & 0x03) << 3) | (b4 >> 5)])
+                result.append(alpha[b4 & 0x1F])
+        elif bits_per_char == 4:
+            for i in range(length):
+                b0 = src[i]
+                result.append(alpha[b0 >> 4])
+                result.append(alpha[b0 & 0x0F])
         else:
-            output_multiple = 0
+            n = 0
 
+        # Generic shift window: keep at most bits_per_char + 7 pending bits
+        for i in range(n, length):
+            acc = (acc << 8) | src[i]
+            nbits += 8
+            while nbits >= bits_per_char:
+                nbits -= bits_per_char
+                result.append(alpha[(acc >> nbits) & mask])
+            acc &= (1ULL << nbits) - 1
+        if nbits:
+            result.append(alpha[(acc << (bits_per_char - nbits)) & mask])
+
+        output_multiple = self._pad_multiple
         if output_multiple > 0:
             padding_chars = (output_multiple - len(result) % output_multiple) % output_multiple
             result.extend('=' * padding_chars)
@@ -207,35 +1164,130 @@ cdef class BaseXEncoder:
         return ''.join(result)
 
     cdef bytes _decode_rfc4648(self, str data):
-        import math
-        cdef str data_stripped = data.rstrip('=')
-        cdef int bits_per_char
-        cdef str bits
-        cdef int valid_bytes
+        cdef int bits_per_char = self._bits_per_char
+        cdef bytes raw
+        cdef const unsigned char* src
+        cdef const unsigned char* lut
+        cdef Py_ssize_t length
+        cdef Py_ssize_t i
+        cdef Py_ssize_t j = 0
+        cdef Py_ssize_t done
+        cdef unsigned char hi, lo
+        cdef unsigned int value
+        cdef unsigned long long acc = 0
+        cdef int nbits = 0
+        cdef unsigned char err = 0
         cdef bytes result
+        cdef unsigned char* out
+
+        if self._get_decode_lut() is None:
+            return self._decode_rfc4648_dict(data.rstrip('='), bits_per_char)
 
-        for char in data_stripped:
+        # Symbols are read in place from one-byte strs, and the padding is
+        # cut off by length rather than by copying through rstrip()
+        src = basex_latin1_data(data)
+        if src == NULL:
+            try:
+                raw = data.encode('latin-1')
+            except UnicodeEncodeError:
+                self._raise_invalid_character(data)
+            src = raw
+        lut = self._decode_lut
+        length = len(data)
+        while length > 0 and src[length - 1] == ord('='):
+            length -= 1
+
+        # Every symbol fills the output exactly, so it is allocated as the
+        # final bytes object and written in place
+        result = PyBytes_FromStringAndSize(NULL, (length * bits_per_char) // 8)
+        out = <unsigned char*>PyBytes_AS_STRING(result)
+
+        # Valid values stay below 0x80 (at most base128), so OR-ing every
+        # looked-up value and testing the high bit once at the end replaces
+        # a branch per symbol; the output is discarded on error.
+        if bits_per_char == 4:
+            # Base16: fuse each pair of symbols into one byte
+            i = 0
+            while i + 1 < length:
+                hi = lut[src[i]]
+                lo = lut[src[i + 1]]
+                err |= hi | lo
+                out[j] = (hi << 4) | lo
+                j += 1
+                i += 2
+            if length % 2:
+                err |= lut[src[length - 1]]
+            if err & 0x80:
+                self._raise_invalid_character(data)
+            return result
+
+        # Whole 64-symbol base64 blocks through the vector kernel, if any
+        done = 0
+        if bits_per_char == 6:
+            if _HAVE_AVX512VBMI:
+                done = basex_b64_decode_vbmi(src, length, lut, out)
+            elif BASEX_HAVE_NEON:
+                done = basex_b64_decode_neon(src, length, lut, out)
+            j = done // 4 * 3
+
+        for i in range(done, length):
+            value = lut[src[i]]
+            err |= value
+            acc = (acc << bits_per_char) | value
+            nbits += bits_per_char
+            if nbits >= 8:
+                nbits -= 8
+                out[j] = (acc >> nbits) & 0xFF
+                j += 1
+                acc &= (1ULL << nbits) - 1
+
+        if err & 0x80:
+            self._raise_invalid_character(data)
+        return result
+
+    cdef bytes _decode_rfc4648_dict(self, str data, int bits_per_char):
+        # Slow path for alphabets with symbols outside latin-1
+        cdef unsigned long long acc = 0
+        cdef int nbits = 0
+        cdef bytearray result = bytearray()
+
+        for char in data:
             if char not in self._decode_map:
                 raise ValueError(f"Invalid character: {char}")
 
-        bits_per_char = int(math.log2(self.base))
+        for char in data:
+            acc = (acc << bits_per_char) | <unsigned long long>self._decode_map[char]
+            nbits += bits_per_char
+            while nbits >= 8:
+                nbits -= 8
+                result.append((acc >> nbits) & 0xFF)
+            acc &= (1ULL << nbits) - 1
 
-        bits = ''.join(f'{self._decode_map[char]:0{bits_per_char}b}' for char in data_stripped)
-        valid_bytes = len(bits) // 8
-        bits = bits[:valid_bytes * 8]
+        return bytes(result)
 
-        result = bytes(int(bits[i:i+8], 2) for i in range(0, len(bits), 8))
-        return result
+    cdef _raise_invalid_character(self, str data):
+        # Re-scan to name the first offending character once a decode loop
+        # has already detected one.
+        for char in data:
+            if char not in self._decode_map:
+                raise ValueError(f"Invalid character: {char}")
 
 
-def init(str alphabet, mode: Mode = Mode.DEFAULT) -> BaseXEncoder:
+# Encoders are shared by (alphabet, mode) so that repeated init() calls
+# skip validation and table construction; their attributes are read-only.
+@functools.lru_cache(maxsize=64)
+def _cached_encoder(str alphabet, mode):
     return BaseXEncoder(alphabet, mode)
 
 
+def init(str alphabet, mode: Mode = Mode.DEFAULT) -> BaseXEncoder:
+    return _cached_encoder(alphabet, mode)
+
+
 def encode(object data, str alphabet, mode: Mode = Mode.DEFAULT) -> str:
-    return BaseXEncoder(alphabet, mode).encode(data)
+    return _cached_encoder(alphabet, mode).encode(data)
 
 
 def decode(str data, str alphabet, mode: Mode = Mode.DEFAULT) -> bytes:
-    return BaseXEncoder(alphabet, mode).decode(data)
+    return _cached_encoder(alphabet, mode).decode(data)
 
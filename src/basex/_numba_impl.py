@@ -0,0 +1,213 @@
+"""Numba-accelerated implementation of base encoding/decoding.
+
+This module provides a BaseXEncoder that compiles the numeric (DEFAULT
+mode) conversion loops with Numba. It is a middle rung between the
+Cython extension and the pure Python module: no compile step at install
+time, but the integer arithmetic runs as machine code.
+
+The number is held as an array of 32-bit limbs so that every step of the
+conversion is a 64-bit operation: one limb shifted in above a remainder
+below 2**32, or one limb multiplied by a factor below 2**32 plus a carry.
+The kernels release the GIL, so threads converting separate inputs run
+them in parallel. RFC 4648 mode is inherited unchanged from the pure
+Python implementation.
+
+Importing this module raises ImportError when numba or numpy is missing.
+"""
+
+import functools
+
+import numba
+import numpy as np
+
+from basex import basex as _python
+from basex.modes import Mode
+
+_LIMB_BITS = 32
+
+
+@numba.njit(cache=True, nogil=True)
+def _numeric_encode_chunks(limbs, base, chunk_div, chunk_k, out):
+    """Convert big-endian 32-bit limbs to symbol values, least significant first.
+
+    Divides the limbs in place by chunk_div (a power of the base below
+    2**32) until they are zero, splitting each remainder into chunk_k
+    symbol values. Returns the number of values written to out, without
+    the zero values that pad the most significant super-digit.
+    """
+    base = np.uint64(base)
+    chunk_div = np.uint64(chunk_div)
+    shift = np.uint64(_LIMB_BITS)
+    n = limbs.shape[0]
+    start = 0
+    count = 0
+    while start < n and limbs[start] == 0:
+        start += 1
+    while start < n:
+        rem = np.uint64(0)
+        for i in range(start, n):
+            cur = (rem << shift) | np.uint64(limbs[i])
+            quot = cur // chunk_div
+            limbs[i] = quot
+            rem = cur - quot * chunk_div
+        while start < n and limbs[start] == 0:
+            start += 1
+        for _ in range(chunk_k):
+            quot = rem // base
+            out[count] = rem - quot * base
+            rem = quot
+            count += 1
+    while count > 0 and out[count - 1] == 0:
+        count -= 1
+    return count
+
+
+@numba.njit(cache=True, nogil=True)
+def _numeric_decode_chunks(values, base, chunk_div, chunk_k, limbs):
+    """Fold symbol values into little-endian 32-bit limbs.
+
+    Values are combined chunk_k at a time into a super-digit, which is then
+    multiplied into the limbs with a single carry pass. Returns the number
+    of limbs in use.
+    """
+    base = np.uint64(base)
+    shift = np.uint64(_LIMB_BITS)
+    mask = np.uint64(0xFFFFFFFF)
+    n = values.shape[0]
+    used = 0
+
+    # Leading partial chunk first so that the rest splits evenly
+    i = 0
+    group = n % chunk_k
+    if group == 0:
+        group = chunk_k
+    while i < n:
+        small = np.uint64(0)
+        mul = np.uint64(1)
+        for j in range(i, i + group):
+            small = small * base + np.uint64(values[j])
+            mul *= base
+        carry = small
+        for j in range(used):
+            cur = np.uint64(limbs[j]) * mul + carry
+            limbs[j] = cur & mask
+            carry = cur >> shift
+        if carry:
+            limbs[used] = carry
+            used += 1
+        i += group
+        group = chunk_k
+    return used
+
+
+class BaseXEncoder(_python.BaseXEncoder):
+    """Encoder/decoder for arbitrary base alphabets, numeric mode via Numba.
+
+    Accepts the same arguments and produces the same results as
+    basex.basex.BaseXEncoder; only the numeric block conversions differ.
+    """
+
+    def __init__(self, alphabet: str, mode: Mode = Mode.DEFAULT):
+        super().__init__(alphabet, mode)
+
+        # Super-digits for the limb kernels must stay below 2**32; the
+        # inherited chunk_k still drives the recursive splitting.
+        nb_chunk_k = 1
+        while self.base ** (nb_chunk_k + 1) < 1 << _LIMB_BITS:
+            nb_chunk_k += 1
+        self._nb_chunk_k = nb_chunk_k
+        self._nb_chunk_div = self.base**nb_chunk_k
+        self._nb_chunk_bits = self._nb_chunk_div.bit_length() - 1
+
+        # The kernels are quadratic but far cheaper per step than big-int
+        # divmod, so whole inputs up to this size skip the recursion.
+        self._recursion_cutoff = 64 * self._chunk_k
+
+        if self._alpha_bytes is not None:
+            self._alpha_array = np.frombuffer(self._alpha_bytes, dtype=np.uint8)
+        else:
+            self._alpha_array = np.array(self._alpha_tuple, dtype=object)
+
+    def _encode_numeric_block(self, num: int) -> str:
+        """Convert an integer to symbols without leading zero symbols.
+
+        The integer is exported as big-endian 32-bit limbs and converted by
+        _numeric_encode_chunks. Returns an empty string for zero.
+        """
+        if num == 0:
+            return ""
+        limb_count = -(-num.bit_length() // _LIMB_BITS)
+        limbs = np.frombuffer(num.to_bytes(limb_count * 4, "big"), dtype=">u4")
+        limbs = limbs.astype(np.uint32)
+
+        chunk_k = self._nb_chunk_k
+        out = np.empty(
+            (limb_count * _LIMB_BITS // self._nb_chunk_bits + 1) * chunk_k,
+            dtype=np.uint32,
+        )
+        count = _numeric_encode_chunks(
+            limbs, self.base, self._nb_chunk_div, chunk_k, out
+        )
+        symbols = self._alpha_array[out[count - 1 :: -1]]
+        if self._alpha_bytes is not None:
+            return symbols.tobytes().decode("ascii")
+        return "".join(symbols)
+
+    def _decode_numeric_block(self, values: bytes | list) -> int:
+        """Convert symbol values to an integer.
+
+        Values are folded into little-endian 32-bit limbs by
+        _numeric_decode_chunks and imported with int.from_bytes.
+        """
+        if isinstance(values, bytes):
+            values = np.frombuffer(values, dtype=np.uint8)
+        else:
+            values = np.array(values, dtype=np.uint32)
+        if values.shape[0] == 0:
+            return 0
+
+        limbs = np.zeros(
+            values.shape[0] * self.base.bit_length() // _LIMB_BITS + 2,
+            dtype=np.uint32,
+        )
+        used = _numeric_decode_chunks(
+            values, self.base, self._nb_chunk_div, self._nb_chunk_k, limbs
+        )
+        return int.from_bytes(limbs[:used].astype("<u4").tobytes(), "little")
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_encoder(alphabet: str, mode: Mode) -> BaseXEncoder:
+    """Build the encoder shared by every init() call with these arguments."""
+    return BaseXEncoder(alphabet, mode)
+
+
+def init(alphabet: str, mode: Mode = Mode.DEFAULT) -> BaseXEncoder:
+    """Return a cached encoder instance for the alphabet and mode.
+
+    Args:
+        alphabet: String of unique characters for the target base.
+        mode: Encoding mode (DEFAULT or RFC4648).
+
+    Returns:
+        Configured BaseXEncoder instance, shared between calls.
+    """
+    if not isinstance(alphabet, str):
+        return BaseXEncoder(alphabet, mode)
+    return _cached_encoder(alphabet, mode)
+
+
+def encode(data: str | bytes, alphabet: str, mode: Mode = Mode.DEFAULT) -> str:
+    """Encode data directly without creating an encoder instance.
+
+    Convenience function for one-off encoding operations.
+    """
+    return init(alphabet, mode).encode(data)
+
+
+def decode(data: str, alphabet: str, mode: Mode = Mode.DEFAULT) -> bytes:
+    """Decode data directly without creating an encoder instance.
+
+    Convenience function for one-off decoding operations.
+    """
+    return init(alphabet, mode).decode(data)
@@ -0,0 +1,280 @@
+/* Vectorized RFC 4648 kernels for the Cython extension.
+ *
+ * Every kernel works on any ASCII alphabet of the right size and only
+ * handles whole blocks: it returns how many input bytes it consumed and
+ * leaves the remainder to the scalar loops in _basex.pyx. x86 kernels are
+ * compiled with per-function target attributes, so the extension builds
+ * without special flags and picks them at run time from CPU detection;
+ * NEON is part of the aarch64 baseline and needs no detection. Builds
+ * without a supported compiler get stubs that consume nothing.
+ */
+
+#ifndef BASEX_SIMD_H
+#define BASEX_SIMD_H
+
+#include <stddef.h>
+#include <stdint.h>
+
+#if (defined(__x86_64__) || defined(__i386__)) && (defined(__GNUC__) || defined(__clang__))
+#define BASEX_X86_SIMD 1
+#include <immintrin.h>
+#else
+#define BASEX_X86_SIMD 0
+#endif
+
+#if defined(__aarch64__) || defined(_M_ARM64)
+#define BASEX_HAVE_NEON 1
+#include <arm_neon.h>
+#else
+#define BASEX_HAVE_NEON 0
+#endif
+
+#if BASEX_X86_SIMD
+
+static int basex_cpu_has_avx2(void) {
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx2");
+}
+
+/* Map 6-bit indices (one per byte) to alphabet bytes: four 16-entry
+   shuffles, one per group of 16 symbols, selected by bits 4-5. */
+__attribute__((target("avx2")))
+static inline __m256i basex_avx2_lookup64(__m256i idx, const __m256i tables[4]) {
+    __m256i group = _mm256_and_si256(_mm256_srli_epi16(idx, 4), _mm256_set1_epi8(0x03));
+    __m256i res = _mm256_shuffle_epi8(tables[0], idx);
+    res = _mm256_blendv_epi8(res, _mm256_shuffle_epi8(tables[1], idx),
+                             _mm256_cmpeq_epi8(group, _mm256_set1_epi8(1)));
+    res = _mm256_blendv_epi8(res, _mm256_shuffle_epi8(tables[2], idx),
+                             _mm256_cmpeq_epi8(group, _mm256_set1_epi8(2)));
+    res = _mm256_blendv_epi8(res, _mm256_shuffle_epi8(tables[3], idx),
+                             _mm256_cmpeq_epi8(group, _mm256_set1_epi8(3)));
+    return res;
+}
+
+/* Base64 encode 24 input bytes into 32 symbols per iteration (Mula's
+   shuffle + multiply unpacking). Each iteration reads 28 bytes, so the
+   loop stops while at least 4 bytes past the block remain. */
+__attribute__((target("avx2")))
+static size_t basex_b64_encode_avx2(const uint8_t *src, size_t len,
+                                    const uint8_t *alpha, uint8_t *dst) {
+    __m256i tables[4];
+    const __m256i shuf = _mm256_setr_epi8(
+        1, 0, 2, 1, 4, 3, 5, 4, 7, 6, 8, 7, 10, 9, 11, 10,
+        1, 0, 2, 1, 4, 3, 5, 4, 7, 6, 8, 7, 10, 9, 11, 10);
+    const __m256i mask_hi = _mm256_set1_epi32(0x0fc0fc00);
+    const __m256i mul_hi = _mm256_set1_epi32(0x04000040);
+    const __m256i mask_lo = _mm256_set1_epi32(0x003f03f0);
+    const __m256i mul_lo = _mm256_set1_epi32(0x01000010);
+    size_t i = 0;
+    int t;
+
+    for (t = 0; t < 4; t++) {
+        tables[t] = _mm256_broadcastsi128_si256(
+            _mm_loadu_si128((const __m128i *)(alpha + 16 * t)));
+    }
+
+    while (len - i >= 28) {
+        __m256i in = _mm256_inserti128_si256(
+            _mm256_castsi128_si256(_mm_loadu_si128((const __m128i *)(src + i))),
+            _mm_loadu_si128((const __m128i *)(src + i + 12)), 1);
+        __m256i idx;
+
+        in = _mm256_shuffle_epi8(in, shuf);
+        idx = _mm256_or_si256(
+            _mm256_mulhi_epu16(_mm256_and_si256(in, mask_hi), mul_hi),
+            _mm256_mullo_epi16(_mm256_and_si256(in, mask_lo), mul_lo));
+        _mm256_storeu_si256((__m256i *)dst, basex_avx2_lookup64(idx, tables));
+        dst += 32;
+        i += 24;
+    }
+    return i;
+}
+
+static int basex_cpu_has_avx512vbmi(void) {
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx512vbmi") && __builtin_cpu_supports("avx512bw");
+}
+
+/* Base64 encode 48 input bytes into 64 symbols per iteration: one byte
+   permute spreads each 3-byte group over a dword, multishift extracts the
+   four 6-bit fields and a second permute (which only looks at the low six
+   index bits) maps them through the 64-byte alphabet. Each iteration
+   reads 64 bytes. */
+__attribute__((target("avx512f,avx512bw,avx512vbmi")))
+static size_t basex_b64_encode_vbmi(const uint8_t *src, size_t len,
+                                    const uint8_t *alpha, uint8_t *dst) {
+    const __m512i shuf = _mm512_setr_epi32(
+        0x01020001, 0x04050304, 0x07080607, 0x0a0b090a,
+        0x0d0e0c0d, 0x10110f10, 0x13141213, 0x16171516,
+        0x191a1819, 0x1c1d1b1c, 0x1f201e1f, 0x22232122,
+        0x25262425, 0x28292728, 0x2b2c2a2b, 0x2e2f2d2e);
+    const __m512i shifts = _mm512_set1_epi64(0x3036242a1016040aLL);
+    const __m512i table = _mm512_loadu_si512((const void *)alpha);
+    size_t i = 0;
+
+    while (len - i >= 64) {
+        __m512i in = _mm512_loadu_si512((const void *)(src + i));
+        __m512i idx = _mm512_multishift_epi64_epi8(shifts, _mm512_permutexvar_epi8(shuf, in));
+        _mm512_storeu_si512((void *)dst, _mm512_permutexvar_epi8(idx, table));
+        dst += 64;
+        i += 48;
+    }
+    return i;
+}
+
+/* Base64 decode 64 symbols into 48 bytes per iteration. lut is the
+   256-entry decode table (0xFF marks invalid symbols); its first 128
+   entries drive a two-register byte permute. A block containing a byte
+   >= 0x80 or an invalid symbol stops the loop, so the scalar code sees
+   it and reports the error. */
+__attribute__((target("avx512f,avx512bw,avx512vbmi")))
+static size_t basex_b64_decode_vbmi(const uint8_t *src, size_t len,
+                                    const uint8_t *lut, uint8_t *dst) {
+    const __m512i lut_lo = _mm512_loadu_si512((const void *)lut);
+    const __m512i lut_hi = _mm512_loadu_si512((const void *)(lut + 64));
+    const __m512i merge_ab = _mm512_set1_epi32(0x01400140);
+    const __m512i merge_abcd = _mm512_set1_epi32(0x00011000);
+    const __m512i pack = _mm512_setr_epi32(
+        0x06000102, 0x090a0405, 0x0c0d0e08, 0x16101112,
+        0x191a1415, 0x1c1d1e18, 0x26202122, 0x292a2425,
+        0x2c2d2e28, 0x36303132, 0x393a3435, 0x3c3d3e38,
+        0, 0, 0, 0);
+    size_t i = 0;
+
+    while (len - i >= 64) {
+        __m512i in = _mm512_loadu_si512((const void *)(src + i));
+        __m512i values = _mm512_permutex2var_epi8(lut_lo, in, lut_hi);
+        __m512i merged;
+
+        if (_mm512_movepi8_mask(_mm512_or_si512(in, values)))
+            break;
+        merged = _mm512_madd_epi16(_mm512_maddubs_epi16(values, merge_ab), merge_abcd);
+        _mm512_mask_storeu_epi8((void *)dst, 0x0000FFFFFFFFFFFFULL,
+                                _mm512_permutexvar_epi8(pack, merged));
+        dst += 48;
+        i += 64;
+    }
+    return i;
+}
+
+#else
+
+static int basex_cpu_has_avx2(void) { return 0; }
+
+static int basex_cpu_has_avx512vbmi(void) { return 0; }
+
+static size_t basex_b64_encode_avx2(const uint8_t *src, size_t len,
+                                    const uint8_t *alpha, uint8_t *dst) {
+    (void)src; (void)len; (void)alpha; (void)dst;
+    return 0;
+}
+
+static size_t basex_b64_encode_vbmi(const uint8_t *src, size_t len,
+                                    const uint8_t *alpha, uint8_t *dst) {
+    (void)src; (void)len; (void)alpha; (void)dst;
+    return 0;
+}
+
+static size_t basex_b64_decode_vbmi(const uint8_t *src, size_t len,
+                                    const uint8_t *lut, uint8_t *dst) {
+    (void)src; (void)len; (void)lut; (void)dst;
+    return 0;
+}
+
+#endif
+
+#if BASEX_HAVE_NEON
+
+/* Base64 encode 48 input bytes into 64 symbols per iteration: vld3
+   deinterleaves the bytes of each 3-byte group into three registers, the
+   four 6-bit fields are cut out with shifts and masks, looked up in the
+   alphabet (four 16-byte tables) and reinterleaved by vst4. */
+static size_t basex_b64_encode_neon(const uint8_t *src, size_t len,
+                                    const uint8_t *alpha, uint8_t *dst) {
+    uint8x16x4_t table;
+    size_t i = 0;
+
+    table.val[0] = vld1q_u8(alpha);
+    table.val[1] = vld1q_u8(alpha + 16);
+    table.val[2] = vld1q_u8(alpha + 32);
+    table.val[3] = vld1q_u8(alpha + 48);
+
+    while (len - i >= 48) {
+        uint8x16x3_t in = vld3q_u8(src + i);
+        uint8x16x4_t out;
+
+        out.val[0] = vshrq_n_u8(in.val[0], 2);
+        out.val[1] = vorrq_u8(vshrq_n_u8(in.val[1], 4),
+                              vandq_u8(vshlq_n_u8(in.val[0], 4), vdupq_n_u8(0x30)));
+        out.val[2] = vorrq_u8(vshrq_n_u8(in.val[2], 6),
+                              vandq_u8(vshlq_n_u8(in.val[1], 2), vdupq_n_u8(0x3C)));
+        out.val[3] = vandq_u8(in.val[2], vdupq_n_u8(0x3F));
+        out.val[0] = vqtbl4q_u8(table, out.val[0]);
+        out.val[1] = vqtbl4q_u8(table, out.val[1]);
+        out.val[2] = vqtbl4q_u8(table, out.val[2]);
+        out.val[3] = vqtbl4q_u8(table, out.val[3]);
+        vst4q_u8(dst, out);
+        dst += 64;
+        i += 48;
+    }
+    return i;
+}
+
+/* Base64 decode 64 symbols into 48 bytes per iteration. Symbols are
+   looked up in the first 128 entries of the 256-entry decode table as two
+   64-byte halves (vqtbl4 yields 0 for indices past its table). A block
+   with a byte >= 0x80 or an invalid symbol (0xFF) stops the loop so that
+   the scalar code reports it. */
+static size_t basex_b64_decode_neon(const uint8_t *src, size_t len,
+                                    const uint8_t *lut, uint8_t *dst) {
+    uint8x16x4_t lut_lo, lut_hi;
+    const uint8x16_t offset = vdupq_n_u8(64);
+    size_t i = 0;
+    int k;
+
+    for (k = 0; k < 4; k++) {
+        lut_lo.val[k] = vld1q_u8(lut + 16 * k);
+        lut_hi.val[k] = vld1q_u8(lut + 64 + 16 * k);
+    }
+
+    while (len - i >= 64) {
+        uint8x16x4_t in = vld4q_u8(src + i);
+        uint8x16x3_t out;
+        uint8x16_t err = vdupq_n_u8(0);
+
+        for (k = 0; k < 4; k++) {
+            uint8x16_t c = in.val[k];
+            in.val[k] = vorrq_u8(vqtbl4q_u8(lut_lo, c),
+                                 vqtbl4q_u8(lut_hi, vsubq_u8(c, offset)));
+            err = vorrq_u8(err, vorrq_u8(c, in.val[k]));
+        }
+        if (vmaxvq_u8(err) >= 0x80)
+            break;
+
+        out.val[0] = vorrq_u8(vshlq_n_u8(in.val[0], 2), vshrq_n_u8(in.val[1], 4));
+        out.val[1] = vorrq_u8(vshlq_n_u8(in.val[1], 4), vshrq_n_u8(in.val[2], 2));
+        out.val[2] = vorrq_u8(vshlq_n_u8(in.val[2], 6), in.val[3]);
+        vst3q_u8(dst, out);
+        dst += 48;
+        i += 64;
+    }
+    return i;
+}
+
+#else
+
+static size_t basex_b64_encode_neon(const uint8_t *src, size_t len,
+                                    const uint8_t *alpha, uint8_t *dst) {
+    (void)src; (void)len; (void)alpha; (void)dst;
+    return 0;
+}
+
+static size_t basex_b64_decode_neon(const uint8_t *src, size_t len,
+                                    const uint8_t *lut, uint8_t *dst) {
+    (void)src; (void)len; (void)lut; (void)dst;
+    return 0;
+}
+
+#endif
+
+#endif /* BASEX_SIMD_H */
@@ -9,8 +9,137 @@ This is the fallback implementation used when compiled Cython extensions
 are not available.
 """
 
+import base64
+import binascii
+import functools
+import math
+import sys
+
+from basex.constants import BASE16_ALPHABET, BASE32_ALPHABET, BASE64_ALPHABET
 from basex.modes import Mode
 
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+_LOG_256 = math.log(256)
+
+# Maps base16 symbol values (0-15) to the ASCII hex digits of hexlify
+_HEX_DIGITS = b"0123456789abcdef" + bytes(240)
+
+# Maps base64 symbol values (0-63) back to standard symbols for a2b_base64
+_BASE64_SYMBOLS = BASE64_ALPHABET.encode("ascii") + bytes(192)
+
+# The standard RFC 4648 alphabets can use the C codecs of the base64 module.
+# Base16 decoding is left out: the translate/unhexlify path below is faster
+# than base64.b16decode.
+_NATIVE_ENCODERS = {
+    BASE64_ALPHABET: base64.b64encode,
+    BASE32_ALPHABET: base64.b32encode,
+    BASE16_ALPHABET: base64.b16encode,
+}
+_NATIVE_DECODERS = {
+    BASE64_ALPHABET: functools.partial(base64.b64decode, validate=True),
+    BASE32_ALPHABET: base64.b32decode,
+}
+
+# pybase64 wraps the SIMD libbase64 codec and is preferred for base64 when
+# installed; it accepts exactly the input that base64.b64decode does.
+if pybase64 is not None:
+    _NATIVE_ENCODERS[BASE64_ALPHABET] = pybase64.b64encode
+    _NATIVE_DECODERS[BASE64_ALPHABET] = functools.partial(
+        pybase64.b64decode, validate=True
+    )
+
+# Super-digits span two PyLong digits (60 bits on the usual 30-bit-digit
+# builds): a one-digit divisor takes more, cheaper divisions and measures
+# slower. Capped so a super-digit always fits in a C unsigned long long.
+_CHUNK_BITS = min(2 * sys.int_info.bits_per_digit, 60)
+
+
+def _pick_chunk_k(base: int) -> int:
+    """Return the largest k with base**k within _CHUNK_BITS bits."""
+    chunk_k = 1
+    while base ** (chunk_k + 1) <= 1 << _CHUNK_BITS:
+        chunk_k += 1
+    return chunk_k
+
+
+@functools.cache
+def _block_codec(base: int, chunk_k: int) -> tuple:
+    """Compile numeric block loops specialized for one base and chunk size.
+
+    Returns (emit, fold). emit(num, alpha, append) appends the symbols of
+    num least significant first, zero-padded to whole super-digits;
+    fold(values) converts symbol values to an integer. The inner loop over
+    a super-digit is unrolled with base, chunk_k and base**chunk_k as
+    constants, which CPython runs markedly faster than the generic loop.
+    """
+    chunk_div = base**chunk_k
+    names = [f"v{i}" for i in range(chunk_k)]
+    lines = [
+        "def emit(num, alpha, append):",
+        "    while num > 0:",
+        f"        num, rem = divmod(num, {chunk_div})",
+    ]
+    for _ in range(chunk_k):
+        lines.append(f"        append(alpha[rem % {base}])")
+        lines.append(f"        rem //= {base}")
+    lines += [
+        "",
+        "def fold(values):",
+        f"    head = len(values) % {chunk_k}",
+        "    num = 0",
+        "    for value in values[:head]:",
+        f"        num = num * {base} + value",
+        f"    for i in range(head, len(values), {chunk_k}):",
+        f"        {', '.join(names)}, = values[i : i + {chunk_k}]",
+        "        small = v0",
+    ]
+    for name in names[1:]:
+        lines.append(f"        small = small * {base} + {name}")
+    lines += [
+        f"        num = num * {chunk_div} + small",
+        "    return num",
+    ]
+    namespace = {}
+    code = compile("\n".join(lines), f"<basex block codec base {base}>", "exec")
+    # The source is assembled only from the ints base, chunk_k and chunk_div
+    exec(code, namespace)  # noqa: S102
+    return namespace["emit"], namespace["fold"]
+
+
+def _buffer_bytes(data) -> bytes:
+    """Copy a bytes-like object other than bytes, such as bytearray.
+
+    Raises:
+        TypeError: If data does not support the buffer protocol.
+    """
+    try:
+        return memoryview(data).tobytes()
+    except TypeError:
+        raise TypeError(
+            f"Data must be str or bytes, got {type(data).__name__}"
+        ) from None
+
+
+def _leading_zero_count(buf: bytes | list, zero: int = 0) -> int:
+    """Count leading elements of buf equal to zero.
+
+    Inputs without leading zeros (the common case) are answered from the
+    first element, so lstrip() only copies inputs that do have a run of
+    zeros, which it then skips in C rather than in a Python loop.
+    """
+    if not buf or buf[0] != zero:
+        return 0
+    if isinstance(buf, bytes):
+        return len(buf) - len(buf.lstrip(bytes((zero,))))
+    for i, value in enumerate(buf):
+        if value != zero:
+            return i
+    return len(buf)
+
 
 class BaseXEncoder:
     """Encoder/decoder for arbitrary base alphabets.
@@ -53,20 +182,120 @@ class BaseXEncoder:
                 f"Alphabet must contain at least 2 characters, got {len(alphabet)}"
             )
 
-        # Duplicate character validation
-        if len(alphabet) != len(set(alphabet)):
-            raise ValueError("Alphabet contains duplicate characters")
+        # Duplicate character validation, folded into the one pass that also
+        # builds the decode map and the per-symbol size bounds
+        decode_map = {}
+        max_utf8 = 1
+        max_char = ""
+        for idx, char in enumerate(alphabet):
+            if char in decode_map:
+                raise ValueError("Alphabet contains duplicate characters")
+            decode_map[char] = idx
+            if char > max_char:
+                max_char = char
+                max_utf8 = len(char.encode("utf-8"))
+
+        base = len(alphabet)
+        is_pow2 = base & (base - 1) == 0
+
+        # RFC4648 mode is bitwise and needs a power-of-2 alphabet
+        if mode == Mode.RFC4648 and not is_pow2:
+            raise ValueError(
+                f"RFC4648 mode requires power-of-2 alphabet size, got {base}"
+            )
 
         self.alphabet = alphabet
-        self.base = len(alphabet)
+        self.base = base
         self.mode = mode
-        self._decode_map = {char: idx for idx, char in enumerate(alphabet)}
+
+        # Mode dispatch on every call tests a bool instead of comparing enums
+        self._is_rfc4648 = mode == Mode.RFC4648
+
+        # Invariants of the alphabet, hoisted out of the per-call paths
+        self._is_pow2 = is_pow2
+        self._bits_per_char = base.bit_length() - 1 if is_pow2 else None
+        self._pad_multiple = {6: 4, 5: 8}.get(self._bits_per_char, 0)
+        self._max_utf8_per_char = max_utf8
+        self._log_base = math.log(base)
+        self._decode_map = decode_map
+        self._alpha_tuple = tuple(alphabet)
+        self._zero_str = alphabet[0]
+        self._utf8_first = len(self._zero_str.encode("utf-8"))
+
+        # ASCII alphabets build output in a bytearray of symbol bytes and
+        # decode it once, instead of joining one str object per symbol.
+        self._alpha_bytes = alphabet.encode("ascii") if alphabet.isascii() else None
+
+        # Standard alphabets delegate to a C codec where one is faster
+        if mode == Mode.RFC4648:
+            self._native_encode = _NATIVE_ENCODERS.get(alphabet)
+            self._native_decode = _NATIVE_DECODERS.get(alphabet)
+        else:
+            self._native_encode = self._native_decode = None
+
+        # Other ASCII base16 alphabets run hexlify and rename its digits
+        # with bytes.translate; non-ASCII ones encode whole bytes through a
+        # table that yields both symbols in one lookup
+        self._from_hex = self._hex_pair_table = None
+        if mode == Mode.RFC4648 and base == 16:
+            if self._alpha_bytes is not None:
+                self._from_hex = bytes.maketrans(_HEX_DIGITS[:16], self._alpha_bytes)
+            else:
+                self._hex_pair_table = [
+                    alphabet[i >> 4] + alphabet[i & 0x0F] for i in range(256)
+                ]
+
+        # Other ASCII base64 alphabets run the binascii codec and rename
+        # its symbols with one bytes.translate call
+        if mode == Mode.RFC4648 and base == 64 and self._alpha_bytes is not None:
+            self._from_base64 = bytes.maketrans(
+                BASE64_ALPHABET.encode("ascii"), self._alpha_bytes
+            )
+        else:
+            self._from_base64 = None
+
+        # The 256-entry decode table is only possible when every symbol is
+        # a single latin-1 byte; it is built on first decode (_decode_lut).
+        self._lut_eligible = base < 256 and max_char <= "\xff"
+
+        # Numeric mode converts one "super-digit" per big-int division
+        chunk_k = _pick_chunk_k(base)
+        self._chunk_k = chunk_k
+        self._chunk_div = self.base**chunk_k
+
+        # Inputs longer than this many symbols are converted by recursive
+        # splitting; powers of the base used for the splits are memoized.
+        self._recursion_cutoff = 16 * chunk_k
+        self._log2_base = math.log2(self.base)
+        self._pow_cache = {}
+
+    @functools.cached_property
+    def _decode_lut(self) -> bytes | None:
+        """256-entry decode table indexed by code point, or None.
+
+        0xFF marks symbols outside the alphabet. Built lazily so that
+        encode-only instances never pay for it.
+        """
+        if not self._lut_eligible:
+            return None
+        decode_map = self._decode_map
+        return bytes(decode_map.get(chr(c), 0xFF) for c in range(256))
+
+    @functools.cached_property
+    def _numeric_codec(self) -> tuple:
+        """Block loops specialized for this base, see _block_codec().
+
+        Compiled on first numeric-mode use and shared by every encoder of
+        the same base.
+        """
+        return _block_codec(self.base, self._chunk_k)
 
     def encode(self, data: str | bytes) -> str:
         """Encode data to the target alphabet.
 
         Args:
-            data: String (UTF-8) or bytes to encode.
+            data: String (UTF-8), bytes, or another bytes-like object such
+                as bytearray or memoryview to encode.
 
         Returns:
             Encoded string in the target alphabet.
@@ -77,20 +306,32 @@ class BaseXEncoder:
             >>> encoder.encode(b"test")
             '3yZe7d'
         """
-        # Type validation
-        if not isinstance(data, (str, bytes)):
-            raise TypeError(f"Data must be str or bytes, got {type(data).__name__}")
-
+        # Type validation, ordered so that str and bytes pay one check each
         if isinstance(data, str):
             data = data.encode("utf-8")
+        elif not isinstance(data, bytes):
+            data = _buffer_bytes(data)
 
         if not data:
             return ""
 
-        if self.mode == Mode.RFC4648:
+        if self._is_rfc4648:
             return self._encode_rfc4648(data)
         return self._encode_numeric(data)
 
+    def encode_to_bytes(self, data: str | bytes) -> bytes:
+        """Encode data and return the symbols as UTF-8 bytes.
+
+        Equivalent to encode(data).encode("utf-8"). The compiled extension
+        writes ASCII results straight into the bytes object; here it is a
+        convenience for callers that send the result to a socket or file.
+
+        Examples:
+            >>> encoder.encode_to_bytes(b"test")
+            b'3yZe7d'
+        """
+        return self.encode(data).encode("utf-8")
+
     def decode(self, data: str) -> bytes:
         """Decode data from the target alphabet.
 
@@ -114,10 +355,77 @@ class BaseXEncoder:
         if not data:
             return b""
 
-        if self.mode == Mode.RFC4648:
+        if self._is_rfc4648:
             return self._decode_rfc4648(data)
         return self._decode_numeric(data)
 
+    def encode_batch(self, datas: list[str | bytes]) -> list[str]:
+        """Encode many inputs in one call.
+
+        In RFC4648 mode with an ASCII alphabet the bit slicing for the whole
+        batch is vectorized with NumPy when it is installed. Every other case
+        encodes the inputs one by one, with results identical to encode().
+
+        Args:
+            datas: Strings (UTF-8) or bytes-like objects to encode.
+
+        Returns:
+            List of encoded strings, in input order.
+
+        Examples:
+            >>> b64.encode_batch(["f", b"foo"])
+            ['Zg==', 'Zm9v']
+        """
+        if not self._is_rfc4648 or self._alpha_bytes is None:
+            return [self.encode(data) for data in datas]
+
+        try:
+            import numpy as np
+        except ImportError:
+            return [self.encode(data) for data in datas]
+
+        items = []
+        for data in datas:
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            elif not isinstance(data, bytes):
+                data = _buffer_bytes(data)
+            items.append(data)
+
+        # Smallest whole group of input bytes that maps to whole symbols:
+        # 3 bytes -> 4 chars for base64, 5 -> 8 for base32, 1 -> 2 for base16
+        bits_per_char = self._bits_per_char
+        shared = math.gcd(bits_per_char, 8)
+        group_bytes = bits_per_char // shared
+        group_chars = 8 // shared
+
+        # Zero-pad every input to whole groups and slice all of them at once
+        padded = b"".join(item + b"\x00" * (-len(item) % group_bytes) for item in items)
+        if not padded:
+            return [""] * len(items)
+        groups = np.frombuffer(padded, dtype=np.uint8).reshape(-1, group_bytes)
+        word = np.zeros(len(groups), dtype=np.uint64)
+        for j in range(group_bytes):
+            word = (word << np.uint64(8)) | groups[:, j]
+        shifts = np.arange(group_chars - 1, -1, -1, dtype=np.uint64) * np.uint64(
+            bits_per_char
+        )
+        indices = (word[:, None] >> shifts) & np.uint64(self.base - 1)
+        alpha = np.frombuffer(self._alpha_bytes, dtype=np.uint8)
+        encoded = alpha[indices].tobytes().decode("ascii")
+
+        # Cut each input's symbols back out and replace the zero-pad symbols
+        result = []
+        pos = 0
+        for item in items:
+            chars = (len(item) * 8 + bits_per_char - 1) // bits_per_char
+            text = encoded[pos : pos + chars]
+            pos += (len(item) + group_bytes - 1) // group_bytes * group_chars
+            if self._pad_multiple:
+                text += "=" * (-chars % self._pad_multiple)
+            result.append(text)
+        return result
+
     def max_encoded_length(self, bytes_count: int) -> int:
         """Calculate maximum encoded string length in UTF-8 bytes.
 
@@ -140,57 +448,89 @@ class BaseXEncoder:
         if bytes_count == 0:
             return 0
 
-        if self.mode == Mode.RFC4648:
-            import math
-
-            bits_per_char = int(math.log2(self.base))
+        if self._is_rfc4648:
+            bits_per_char = self._bits_per_char
             bits = bytes_count * 8
             chars = (bits + bits_per_char - 1) // bits_per_char  # ceil division
 
             # Add padding to output multiple
-            pad_map = {6: 4, 5: 8}
-            if bits_per_char in pad_map:
-                output_multiple = pad_map[bits_per_char]
+            output_multiple = self._pad_multiple
+            if output_multiple:
                 chars = (
                     (chars + output_multiple - 1) // output_multiple
                 ) * output_multiple
 
             # Calculate UTF-8 byte length
-            return sum(len(c.encode("utf-8")) for c in self.alphabet[:1]) * chars
+            return self._utf8_first * chars
         else:
             # Numeric mode: worst case is all 0xFF bytes
             # Maximum value is 256^bytes_count - 1
             # In base N: ceil(log_N(256^bytes_count)) = ceil(bytes_count * log_N(256))
-            import math
-
-            if self.base == 1:
-                return bytes_count * 8  # Each bit needs a symbol
-            max_chars = math.ceil(bytes_count * math.log(256) / math.log(self.base))
+            max_chars = math.ceil(bytes_count * _LOG_256 / self._log_base)
             # Account for leading zeros
             max_chars += bytes_count
             # Calculate UTF-8 byte length (worst case: all symbols are max UTF-8 size)
-            max_utf8_bytes_per_char = max(len(c.encode("utf-8")) for c in self.alphabet)
-            return max_chars * max_utf8_bytes_per_char
+            return max_chars * self._max_utf8_per_char
 
     def _encode_numeric(self, data: bytes) -> str:
         """Encode using numeric base conversion.
 
         This method treats the input bytes as a big-endian integer
         and converts it to the target base using mathematical division.
+        Large integers are split recursively so that the divisions work
+        on balanced halves instead of on the whole number each time.
         Preserves leading zero bytes as leading alphabet[0] characters.
         """
         num = int.from_bytes(data, "big")
 
         if num == 0:
-            return self.alphabet[0]
+            return self._zero_str
 
-        result = []
-        while num > 0:
-            num, remainder = divmod(num, self.base)
-            result.append(self.alphabet[remainder])
+        # Upper bound on the symbol count; surplus zeros are stripped below
+        width = int(num.bit_length() / self._log2_base) + 2
+        if width > self._recursion_cutoff:
+            body = self._encode_numeric_recursive(num, width)
+            body = body.lstrip(self._zero_str)
+        else:
+            body = self._encode_numeric_block(num)
 
-        leading_zeros = len(data) - len(data.lstrip(b"\x00"))
-        return self.alphabet[0] * leading_zeros + "".join(reversed(result))
+        leading_zeros = _leading_zero_count(data)
+        return self._zero_str * leading_zeros + body
+
+    def _encode_numeric_block(self, num: int) -> str:
+        """Convert an integer to symbols without leading zero symbols.
+
+        Each big-int division peels off a whole super-digit (base**chunk_k),
+        which is then split into symbols with small-int arithmetic.
+        Returns an empty string for zero.
+        """
+        alpha, result = self._symbol_buffer()
+        self._numeric_codec[0](num, alpha, result.append)
+
+        # The most significant super-digit was zero-padded to chunk_k symbols
+        zero = alpha[0]
+        while result and result[-1] == zero:
+            result.pop()
+
+        result.reverse()
+        return self._join_symbols(result)
+
+    def _encode_numeric_recursive(self, num: int, width: int) -> str:
+        """Convert an integer to exactly ``width`` symbols, zero-padded.
+
+        Splits ``num`` by a power of the base close to half the width and
+        converts both halves independently, down to block-sized pieces.
+        """
+        if width <= self._recursion_cutoff:
+            return self._encode_numeric_block(num).rjust(width, self._zero_str)
+
+        split = self._chunk_k
+        while split * 2 < width:
+            split *= 2
+        hi, lo = divmod(num, self._base_power(split))
+        return self._encode_numeric_recursive(
+            hi, width - split
+        ) + self._encode_numeric_recursive(lo, split)
 
     def _decode_numeric(self, data: str) -> bytes:
         """Decode using numeric base conversion.
@@ -198,15 +538,13 @@ class BaseXEncoder:
         Reverses the numeric encoding process by converting from
         the target base back to a big-endian integer, then to bytes.
         """
-        for char in data:
-            if char not in self._decode_map:
-                raise ValueError(f"Invalid character: {char}")
+        values = self._symbol_values(data)
+        leading_zeros = _leading_zero_count(values)
 
-        leading_zeros = len(data) - len(data.lstrip(self.alphabet[0]))
-
-        num = 0
-        for char in data:
-            num = num * self.base + self._decode_map[char]
+        if len(values) > self._recursion_cutoff:
+            num = self._decode_numeric_recursive(values)
+        else:
+            num = self._decode_numeric_block(values)
 
         if num == 0:
             byte_length = 1
@@ -216,6 +554,42 @@ class BaseXEncoder:
         result = num.to_bytes(byte_length, "big")
         return b"\x00" * leading_zeros + result
 
+    def _decode_numeric_block(self, values: bytes | list) -> int:
+        """Convert symbol values to an integer.
+
+        Values are folded chunk_k at a time into a small int before
+        touching the big-int accumulator, a leading partial chunk first
+        so that the rest splits evenly.
+        """
+        return self._numeric_codec[1](values)
+
+    def _decode_numeric_recursive(self, values: bytes | list) -> int:
+        """Convert symbol values to an integer by recursive splitting.
+
+        Horner's rule applied to halves: value(hi + lo) is
+        value(hi) * base**len(lo) + value(lo).
+        """
+        if len(values) <= self._recursion_cutoff:
+            return self._decode_numeric_block(values)
+
+        split = self._chunk_k
+        while split * 2 < len(values):
+            split *= 2
+        hi = self._decode_numeric_recursive(values[:-split])
+        lo = self._decode_numeric_recursive(values[-split:])
+        return hi * self._base_power(split) + lo
+
+    def _base_power(self, exponent: int) -> int:
+        """Return base**exponent, memoized for the recursive converters.
+
+        Split points are always chunk_k times a power of two, so the cache
+        holds one entry per recursion level.
+        """
+        power = self._pow_cache.get(exponent)
+        if power is None:
+            power = self._pow_cache[exponent] = self.base**exponent
+        return power
+
     def _encode_rfc4648(self, data: bytes) -> str:
         """Encode using RFC 4648 bitwise method.
 
@@ -223,59 +597,195 @@ class BaseXEncoder:
         and adds padding '=' characters to ensure output length is a multiple
         of the specified value (4 for base64, 8 for base32).
         """
-        import math
-
-        bits_per_char = int(math.log2(self.base))
-        if 2**bits_per_char != self.base:
-            raise ValueError(
-                f"RFC4648 mode requires power-of-2 alphabet size, got {self.base}"
-            )
-
-        bits = "".join(f"{byte:08b}" for byte in data)
-        padding_bits = (bits_per_char - len(bits) % bits_per_char) % bits_per_char
-        bits += "0" * padding_bits
-
-        result = []
-        for i in range(0, len(bits), bits_per_char):
-            chunk = bits[i : i + bits_per_char]
-            result.append(self.alphabet[int(chunk, 2)])
-
-        pad_map = {6: 4, 5: 8}
-        if bits_per_char in pad_map:
-            output_multiple = pad_map[bits_per_char]
+        if self._native_encode is not None:
+            return self._native_encode(data).decode("ascii")
+
+        if self._from_hex is not None:
+            return binascii.hexlify(data).translate(self._from_hex).decode("ascii")
+
+        if self._hex_pair_table is not None:
+            return "".join(map(self._hex_pair_table.__getitem__, data))
+
+        if self._from_base64 is not None:
+            encoded = binascii.b2a_base64(data, newline=False)
+            return encoded.translate(self._from_base64).decode("ascii")
+
+        bits_per_char = self._bits_per_char
+        alpha, result = self._symbol_buffer()
+        append = result.append
+
+        # Specialized loops for whole input groups of base64 and base32
+        # (base16 took the pair table above); the remaining tail is handled
+        # by the generic bit window below.
+        n = len(data)
+        if bits_per_char == 6:
+            n -= n % 3
+            for i in range(0, n, 3):
+                b0, b1, b2 = data[i], data[i + 1], data[i + 2]
+                append(alpha[b0 >> 2])
+                append(alpha[((b0 & 0x03) << 4) | (b1 >> 4)])
+                append(alpha[((b1 & 0x0F) << 2) | (b2 >> 6)])
+                append(alpha[b2 & 0x3F])
+        elif bits_per_char == 5:
+            n -= n % 5
+            for i in range(0, n, 5):
+                b0, b1, b2, b3, b4 = data[i : i + 5]
+                append(alpha[b0 >> 3])
+                append(alpha[((b0 & 0x07) << 2) | (b1 >> 6)])
+                append(alpha[(b1 >> 1) & 0x1F])
+                append(alpha[((b1 & 0x01) << 4) | (b2 >> 4)])
+                append(alpha[((b2 & 0x0F) << 1) | (b3 >> 7)])
+                append(alpha[(b3 >> 2) & 0x1F])
+                append(alpha[((b3 & 0x03) << 3) | (b4 >> 5)])
+                append(alpha[b4 & 0x1F])
+        else:
+            n = 0
+
+        # Generic shift window: keep at most bits_per_char + 7 pending bits
+        mask = self.base - 1
+        acc = 0
+        nbits = 0
+        for byte in data[n:]:
+            acc = (acc << 8) | byte
+            nbits += 8
+            while nbits >= bits_per_char:
+                nbits -= bits_per_char
+                append(alpha[(acc >> nbits) & mask])
+            acc &= (1 << nbits) - 1
+        if nbits:
+            append(alpha[(acc << (bits_per_char - nbits)) & mask])
+
+        encoded = self._join_symbols(result)
+
+        output_multiple = self._pad_multiple
+        if output_multiple:
             padding_chars = (
-                output_multiple - len(result) % output_multiple
+                output_multiple - len(encoded) % output_multiple
             ) % output_multiple
-            result.extend("=" * padding_chars)
+            encoded += "=" * padding_chars
 
+        return encoded
+
+    def _symbol_buffer(self) -> tuple:
+        """Return a symbol table and an empty output buffer to append to.
+
+        ASCII alphabets pair the alphabet bytes with a bytearray so that
+        symbols are appended as small ints; other alphabets pair the tuple
+        of symbols with a list of str.
+        """
+        if self._alpha_bytes is not None:
+            return self._alpha_bytes, bytearray()
+        return self._alpha_tuple, []
+
+    def _join_symbols(self, result: bytearray | list) -> str:
+        """Turn a buffer filled via _symbol_buffer() into the encoded str."""
+        if self._alpha_bytes is not None:
+            return result.decode("ascii")
         return "".join(result)
 
     def _decode_rfc4648(self, data: str) -> bytes:
         """Decode using RFC 4648 bitwise method.
 
-        Strips padding, converts each character to its bit representation,
-        and groups the bits back into bytes.
+        Strips padding, maps each character through the decode table and
+        shifts its bits into an accumulator, emitting a byte every time
+        eight bits are available. Trailing bits that do not form a whole
+        byte are discarded.
         """
+        if self._native_decode is not None:
+            # The C codecs only accept canonical padded input, and agree
+            # with the loops below whenever they do; anything they reject
+            # is decoded (or rejected) by the generic path.
+            try:
+                return self._native_decode(data)
+            except ValueError:
+                pass
+
         data = data.rstrip("=")
+        bits_per_char = self._bits_per_char
+
+        values = self._symbol_values(data)
+
+        result = bytearray()
+        append = result.append
+
+        if bits_per_char == 4:
+            # Base16: fuse each pair of symbols into one byte, in C when the
+            # values came from the decode table
+            if isinstance(values, bytes):
+                hex_digits = values.translate(_HEX_DIGITS)
+                return binascii.unhexlify(hex_digits[: len(hex_digits) & ~1])
+            for i in range(0, len(values) - 1, 2):
+                append((values[i] << 4) | values[i + 1])
+            return bytes(result)
+
+        if bits_per_char == 6 and isinstance(values, bytes):
+            # Base64: rename the values to standard symbols and let
+            # binascii decode them. A lone trailing symbol holds no whole
+            # byte, and unused low bits are ignored, as in the loop below.
+            whole = len(values) - (len(values) % 4 == 1)
+            symbols = values[:whole].translate(_BASE64_SYMBOLS)
+            return binascii.a2b_base64(symbols + b"=" * (-whole % 4))
+
+        acc = 0
+        nbits = 0
+        for value in values:
+            acc = (acc << bits_per_char) | value
+            nbits += bits_per_char
+            while nbits >= 8:
+                nbits -= 8
+                append((acc >> nbits) & 0xFF)
+            acc &= (1 << nbits) - 1
+
+        return bytes(result)
+
+    def _symbol_values(self, data: str) -> bytes | list:
+        """Map every character of data to its index in the alphabet.
+
+        With a decode table the whole string is mapped by a single
+        bytes.translate call and checked once for the 0xFF sentinel;
+        otherwise each character is looked up in the decode map.
 
+        Raises:
+            ValueError: If data contains characters not in alphabet.
+        """
+        lut = self._decode_lut
+        if lut is None:
+            try:
+                return [self._decode_map[char] for char in data]
+            except KeyError as exc:
+                raise ValueError(f"Invalid character: {exc.args[0]}") from None
+
+        try:
+            values = data.encode("latin-1").translate(lut)
+        except UnicodeEncodeError:
+            values = b"\xff"
+        if 0xFF in values:
+            self._raise_invalid_character(data)
+        return values
+
+    def _raise_invalid_character(self, data: str) -> None:
+        """Raise ValueError naming the first character not in the alphabet.
+
+        Called only once a decode loop has already detected an invalid
+        symbol, so the hot loops do not need to track its position.
+        """
         for char in data:
             if char not in self._decode_map:
                 raise ValueError(f"Invalid character: {char}")
 
-        import math
-
-        bits_per_char = int(math.log2(self.base))
 
-        bits = "".join(f"{self._decode_map[char]:0{bits_per_char}b}" for char in data)
-        valid_bytes = len(bits) // 8
-        bits = bits[: valid_bytes * 8]
-
-        result = bytes(int(bits[i : i + 8], 2) for i in range(0, len(bits), 8))
-        return result
+@functools.lru_cache(maxsize=64)
+def _cached_encoder(alphabet: str, mode: Mode) -> BaseXEncoder:
+    """Build the encoder shared by every init() call with these arguments."""
+    return BaseXEncoder(alphabet, mode)
 
 
 def init(alphabet: str, mode: Mode = Mode.DEFAULT) -> BaseXEncoder:
-    """Create a new encoder instance.
+    """Return an encoder instance for the alphabet and mode.
+
+    Instances are cached by (alphabet, mode), so repeated calls return the
+    same shared encoder and its tables are built only once. Treat the
+    returned instance as read-only.
 
     Args:
         alphabet: String of unique characters for the target base.
@@ -289,7 +799,10 @@ def init(alphabet: str, mode: Mode = Mode.DEFAULT) -> BaseXEncoder:
         >>> b58.encode("test")
         '3yZe7d'
     """
-    return BaseXEncoder(alphabet, mode)
+    if not isinstance(alphabet, str):
+        # Unhashable, so let the constructor report the type error
+        return BaseXEncoder(alphabet, mode)
+    return _cached_encoder(alphabet, mode)
 
 
 def encode(data: str | bytes, alphabet: str, mode: Mode = Mode.DEFAULT) -> str:
@@ -309,7 +822,7 @@ def encode(data: str | bytes, alphabet: str, mode: Mode = Mode.DEFAULT) -> str:
         >>> encode("test", "123456789ABC...xyz")
         '3yZe7d'
     """
-    return BaseXEncoder(alphabet, mode).encode(data)
+    return init(alphabet, mode).encode(data)
 
 
 def decode(data: str, alphabet: str, mode: Mode = Mode.DEFAULT) -> bytes:
@@ -329,4 +842,4 @@ def decode(data: str, alphabet: str, mode: Mode = Mode.DEFAULT) -> bytes:
         >>> decode("3yZe7d", "123456789ABC...xyz")
         b'test'
     """
-    return BaseXEncoder(alphabet, mode).decode(data)
+    return init(alphabet, mode).decode(data)
@@ -8,12 +8,29 @@ All presets are module-level singletons that can be imported and used directly:
     >>> from basex import b64
     >>> b64.encode("test")
     'dGVzdA=='
+
+When the result goes to a socket or file, encode_to_bytes() returns the
+symbols as bytes; with the compiled extension no intermediate str is built:
+    >>> b64.encode_to_bytes("test")
+    b'dGVzdA=='
+
+The presets are built through init(), so init() with the same alphabet and
+mode returns the preset instance itself.
 """
 
+import functools
+
 try:
-    from basex._basex import BaseXEncoder
+    from basex._basex import init
+
+    _COMPILED = True
 except ImportError:
-    from basex.basex import BaseXEncoder
+    try:
+        from basex._numba_impl import init
+    except ImportError:
+        from basex.basex import init
+
+    _COMPILED = False
 
 from basex.modes import Mode
 from basex.constants import (
@@ -28,7 +45,7 @@ from basex.constants import (
 
 # RFC 4648 Standard Encodings
 
-b64 = BaseXEncoder(BASE64_ALPHABET, Mode.RFC4648)
+b64 = init(BASE64_ALPHABET, Mode.RFC4648)
 """Base64 encoder following RFC 4648 standard.
 
 Uses the standard Base64 alphabet with automatic padding.
@@ -41,7 +58,7 @@ Examples:
     b'foo'
 """
 
-b32 = BaseXEncoder(BASE32_ALPHABET, Mode.RFC4648)
+b32 = init(BASE32_ALPHABET, Mode.RFC4648)
 """Base32 encoder following RFC 4648 standard.
 
 Uses uppercase letters A-Z and digits 2-7.
@@ -52,7 +69,7 @@ Examples:
     'MZXW6==='
 """
 
-b16 = BaseXEncoder(BASE16_ALPHABET, Mode.RFC4648)
+b16 = init(BASE16_ALPHABET, Mode.RFC4648)
 """Base16 (hexadecimal) encoder following RFC 4648 standard.
 
 Standard hex encoding using uppercase letters.
@@ -66,7 +83,7 @@ Examples:
 
 # Cryptocurrency and Human-Readable Encodings
 
-b58 = BaseXEncoder(BASE58_ALPHABET, Mode.DEFAULT)
+b58 = init(BASE58_ALPHABET, Mode.DEFAULT)
 """Base58 encoder following Bitcoin standard.
 
 Excludes visually similar characters: 0 (zero), O (capital o),
@@ -79,7 +96,7 @@ Examples:
     '2NEpo7TZRRrLZSi2U'
 """
 
-b57 = BaseXEncoder(BASE57_ALPHABET, Mode.DEFAULT)
+b57 = init(BASE57_ALPHABET, Mode.DEFAULT)
 """Base57 encoder (Base58 without '1').
 
 Removes '1' in addition to 0OIl to further reduce visual confusion.
@@ -90,7 +107,7 @@ Examples:
     '3orqLftwyK9mqMwUd'
 """
 
-b56 = BaseXEncoder(BASE56_ALPHABET, Mode.DEFAULT)
+b56 = init(BASE56_ALPHABET, Mode.DEFAULT)
 """Base56 encoder (Base58 without '1' and 'o').
 
 Most conservative alphabet for human readability.
@@ -102,4 +119,36 @@ Examples:
 """
 
 
+# Short inputs (keys, hashes, ids) tend to repeat. Without the compiled
+# extension a short numeric encode costs microseconds, so the numeric
+# presets remember the results for recent short inputs. The extension, and
+# the RFC 4648 presets, which already run on the C codecs of base64 and
+# binascii, encode faster than a cache lookup and are left alone.
+_SHORT_INPUT_LENGTH = 16
+
+
+def _cache_short_inputs(encoder):
+    """Route short str and bytes inputs of encoder.encode through an LRU cache.
+
+    Other inputs, including unhashable bytes-like objects, go straight to
+    the original method. Returns the encoder, patched in place.
+    """
+    encode = encoder.encode
+    cached = functools.lru_cache(maxsize=256)(encode)
+
+    @functools.wraps(encode)
+    def encode_cached(data):
+        if type(data) in (str, bytes) and len(data) <= _SHORT_INPUT_LENGTH:
+            return cached(data)
+        return encode(data)
+
+    encoder.encode = encode_cached
+    return encoder
+
+
+if not _COMPILED:
+    for _preset in (b58, b57, b56):
+        _cache_short_inputs(_preset)
+
+
 __all__ = ["b64", "b32", "b16", "b58", "b57", "b56"]
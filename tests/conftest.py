@@ -3,12 +3,13 @@
 import pytest
 
 
-@pytest.fixture(params=["cython", "python"], ids=["cython", "python"])
+@pytest.fixture(params=["cython", "numba", "python"], ids=["cython", "numba", "python"])
 def implementation(request):
     """Fixture that provides both Cython and Python implementations.
 
-    This fixture runs each test twice:
+    This fixture runs each test three times:
     - Once with the Cython-compiled implementation
+    - Once with the Numba implementation (skipped if numba is missing)
     - Once with the pure Python implementation
 
     This ensures both implementations produce identical results and
@@ -19,7 +20,7 @@ def implementation(request):
 
     Returns:
         tuple: (module, impl_name) where module has the same interface
-               for both implementations
+               for every implementation
     """
     if request.param == "cython":
         try:
@@ -45,6 +46,24 @@ def implementation(request):
                 f"Cython implementation not available: {e}\n"
                 "Run 'uv pip install -e .' to compile Cython extensions"
             )
+    elif request.param == "numba":
+        pytest.importorskip("numba")
+        from basex import _numba_impl as nb_impl, modes, presets
+
+        class NumbaImpl:
+            Mode = modes.Mode
+            BaseXEncoder = nb_impl.BaseXEncoder
+            init = staticmethod(nb_impl.init)
+            encode = staticmethod(nb_impl.encode)
+            decode = staticmethod(nb_impl.decode)
+            b64 = presets.b64
+            b32 = presets.b32
+            b16 = presets.b16
+            b58 = presets.b58
+            b57 = presets.b57
+            b56 = presets.b56
+
+        return NumbaImpl(), "numba"
     else:
         # Import pure Python modules and create unified interface
         from basex import basex as py_impl, modes, presets
@@ -80,6 +80,17 @@ BASE56_VECTORS = [
 ]
 
 
+def _reference_encode(data: bytes, alphabet: str) -> str:
+    """Numeric encode by plain divmod, one alphabet[0] per leading zero byte."""
+    num = int.from_bytes(data, "big")
+    digits = []
+    while num:
+        num, remainder = divmod(num, len(alphabet))
+        digits.append(alphabet[remainder])
+    zeros = len(data) - len(data.lstrip(b"\x00"))
+    return alphabet[0] * zeros + "".join(reversed(digits))
+
+
 class TestBaseXInit:
     """Test basex.init() API with instance methods."""
 
@@ -170,6 +181,15 @@ class TestBaseXInit:
         result = b56.decode(expected)
         assert result == input_str.encode("utf-8")
 
+    def test_init_returns_cached_instance(self, implementation):
+        """Repeated init() calls with the same arguments share one encoder."""
+        impl, impl_name = implementation
+        b58 = impl.init(alphabet=BASE58_ALPHABET)
+        assert impl.init(BASE58_ALPHABET, impl.Mode.DEFAULT) is b58
+        assert impl.init(alphabet=BASE16_ALPHABET) is not impl.init(
+            alphabet=BASE16_ALPHABET, mode=impl.Mode.RFC4648
+        )
+
 
 class TestBaseXDirectAPI:
     """Test basex.encode() and basex.decode() direct API."""
@@ -198,6 +218,45 @@ class TestBaseXDirectAPI:
 class TestInputHandling:
     """Test str and bytes input handling."""
 
+    @pytest.mark.parametrize("size", [3, 32, 300])
+    def test_encode_bytes_like_input(self, implementation, size):
+        """bytearray, memoryview and array input should encode like bytes."""
+        import array
+
+        impl, impl_name = implementation
+        data = bytes(i % 255 + 1 for i in range(size))
+        b64 = impl.init(alphabet=BASE64_ALPHABET, mode=impl.Mode.RFC4648)
+        b58 = impl.init(alphabet=BASE58_ALPHABET)
+        for encoder in (b64, b58):
+            expected = encoder.encode(data)
+            assert encoder.encode(bytearray(data)) == expected, impl_name
+            assert encoder.encode(memoryview(data)) == expected, impl_name
+            assert encoder.encode(array.array("B", data)) == expected, impl_name
+            assert encoder.encode(memoryview(b"x" + data)[1:]) == expected, impl_name
+            interleaved = bytearray(2 * size)
+            interleaved[::2] = data
+            assert encoder.encode(memoryview(interleaved)[::2]) == expected, impl_name
+
+    @pytest.mark.parametrize("size", [0, 3, 32, 64, 300, 3000])
+    def test_encode_to_bytes(self, implementation, size):
+        """encode_to_bytes() should return the UTF-8 form of encode()."""
+        impl, impl_name = implementation
+        data = b"\x00" + bytes(i % 255 + 1 for i in range(size))
+        encoders = [
+            impl.init(alphabet=BASE64_ALPHABET, mode=impl.Mode.RFC4648),
+            impl.init(alphabet=BASE64_ALPHABET[:32], mode=impl.Mode.RFC4648),
+            impl.init(alphabet=BASE58_ALPHABET),
+            impl.init(alphabet="αβγδεζηθ"),
+            impl.init(alphabet="αβγδ", mode=impl.Mode.RFC4648),
+        ]
+        for encoder in encoders:
+            for value in (data[1:], data):
+                result = encoder.encode_to_bytes(value)
+                assert type(result) is bytes, impl_name
+                assert result == encoder.encode(value).encode("utf-8"), impl_name
+        assert encoders[0].encode_to_bytes("foo") == b"Zm9v", impl_name
+        assert encoders[2].encode_to_bytes(bytearray(b"test")) == b"3yZe7d", impl_name
+
     def test_encode_str_input(self, implementation):
         """String input should be converted to UTF-8 bytes."""
         impl, impl_name = implementation
@@ -205,6 +264,17 @@ class TestInputHandling:
         result = b64.encode("foo")
         assert result == "Zm9v"
 
+    def test_encode_non_ascii_str_keeps_size(self, implementation):
+        """Encoding a non-ASCII str should not attach a UTF-8 copy to it."""
+        import sys
+
+        impl, impl_name = implementation
+        b64 = impl.init(alphabet=BASE64_ALPHABET, mode=impl.Mode.RFC4648)
+        data = "é" * 1000
+        size = sys.getsizeof(data)
+        assert b64.encode(data) == b64.encode(data.encode("utf-8")), impl_name
+        assert sys.getsizeof(data) == size, impl_name
+
     def test_encode_bytes_input(self, implementation):
         """Bytes input should work directly."""
         impl, impl_name = implementation
@@ -275,6 +345,16 @@ class TestEdgeCases:
         with pytest.raises(ValueError, match="duplicate"):
             impl.init(alphabet="AABC")
 
+    @pytest.mark.parametrize(
+        "alphabet",
+        ["AB\u00e9\u00ff\u00e9", "AB\u4e00C\u4e00", "A\U0001f600B\U0001f600"],
+    )
+    def test_alphabet_uniqueness_non_ascii(self, implementation, alphabet):
+        """Duplicates above ASCII should be detected as well."""
+        impl, impl_name = implementation
+        with pytest.raises(ValueError, match="duplicate"):
+            impl.init(alphabet=alphabet)
+
     def test_invalid_decode_character(self, implementation):
         """Decoding with character not in alphabet should raise error."""
         impl, impl_name = implementation
@@ -311,6 +391,133 @@ class TestEdgeCases:
 
         assert decoded == original_data, f"{impl_name}: Large data roundtrip failed"
 
+    @pytest.mark.parametrize(
+        "alphabet,stdlib_encode",
+        [
+            (BASE64_ALPHABET, "b64encode"),
+            (BASE32_ALPHABET, "b32encode"),
+            (BASE16_ALPHABET, "b16encode"),
+            (BASE64_ALPHABET[:62] + "-_", "urlsafe_b64encode"),
+        ],
+    )
+    def test_rfc4648_matches_stdlib(self, implementation, alphabet, stdlib_encode):
+        """Every input length (all tail/padding cases) should match stdlib."""
+        import base64
+        import random
+
+        impl, impl_name = implementation
+        encoder = impl.init(alphabet=alphabet, mode=impl.Mode.RFC4648)
+        reference = getattr(base64, stdlib_encode)
+        rng = random.Random(4648)
+
+        for length in [*range(32), 70001, 70002]:
+            data = rng.randbytes(length)
+            expected = reference(data).decode("ascii")
+            assert encoder.encode(data) == expected, f"{impl_name}: length {length}"
+
+    def test_rfc4648_custom_base64_alphabet(self, implementation):
+        """A permuted base64 alphabet should match stdlib output, translated."""
+        import base64
+        import random
+
+        impl, impl_name = implementation
+        alphabet = BASE64_ALPHABET[::-1]
+        encoder = impl.init(alphabet=alphabet, mode=impl.Mode.RFC4648)
+        table = str.maketrans(BASE64_ALPHABET, alphabet)
+        rng = random.Random(64)
+
+        for length in list(range(20, 80)) + [1000, 4099]:
+            data = rng.randbytes(length)
+            expected = base64.b64encode(data).decode("ascii").translate(table)
+            assert encoder.encode(data) == expected, f"{impl_name}: length {length}"
+            assert encoder.decode(expected) == data, f"{impl_name}: length {length}"
+
+    def test_rfc4648_custom_base64_unpadded(self, implementation):
+        """Unpadded input decodes; a lone trailing symbol adds no byte."""
+        impl, impl_name = implementation
+        alphabet = BASE64_ALPHABET[::-1]
+        encoder = impl.init(alphabet=alphabet, mode=impl.Mode.RFC4648)
+
+        for length in range(1, 10):
+            data = bytes(range(100, 100 + length))
+            encoded = encoder.encode(data).rstrip("=")
+            assert encoder.decode(encoded) == data, f"{impl_name}: length {length}"
+            if len(encoded) % 4 == 0:
+                assert encoder.decode(encoded + alphabet[7]) == data
+
+    @pytest.mark.parametrize(
+        "alphabet", ["0123456789abcdef", "FEDCBA9876543210", "0123456789αβγδεζ"]
+    )
+    def test_rfc4648_custom_base16(self, implementation, alphabet):
+        """Custom base16 alphabets should rename the digits of hex()."""
+        impl, impl_name = implementation
+        encoder = impl.init(alphabet=alphabet, mode=impl.Mode.RFC4648)
+        rename = str.maketrans("0123456789abcdef", alphabet)
+
+        for data in (b"", bytes(range(256)), bytes(range(256))[::-1] * 300):
+            expected = data.hex().translate(rename)
+            assert encoder.encode(data) == expected, impl_name
+            assert encoder.decode(expected) == data, impl_name
+
+    @pytest.mark.parametrize("size", [1, 64, 512, 2048, 3000])
+    def test_numeric_matches_reference(self, implementation, size):
+        """Chunked and recursive numeric conversion should match plain divmod."""
+        import random
+
+        impl, impl_name = implementation
+        b58 = impl.init(alphabet=BASE58_ALPHABET)
+        data = b"\x00\x00" + random.Random(size).randbytes(size)
+        expected = _reference_encode(data, BASE58_ALPHABET)
+
+        assert b58.encode(data) == expected, f"{impl_name}: size {size}"
+        assert b58.decode(expected) == data, f"{impl_name}: size {size}"
+
+    @pytest.mark.parametrize("size", [32, 64])
+    def test_base58_fixed_sizes_match_reference(self, implementation, size):
+        """Key- and signature-sized inputs should convert like plain divmod."""
+        import random
+
+        impl, impl_name = implementation
+        b58 = impl.init(alphabet=BASE58_ALPHABET)
+        rng = random.Random(size)
+
+        samples = [b"\xff" * size, b"\x00" * (size - 1) + b"\x01"]
+        for zeros in [0, 1, 5, size // 2]:
+            body = b"\x01" + rng.randbytes(size - zeros - 1)
+            samples.append(b"\x00" * zeros + body)
+
+        for data in samples:
+            expected = _reference_encode(data, BASE58_ALPHABET)
+
+            assert b58.encode(data) == expected, f"{impl_name}: {data.hex()}"
+            assert b58.decode(expected) == data, f"{impl_name}: {data.hex()}"
+
+    @pytest.mark.parametrize(
+        "alphabet",
+        [
+            "01",
+            "012",
+            "0123456789",
+            "0123456789" + BASE64_ALPHABET[:52],
+            "".join(map(chr, range(1, 256))),
+        ],
+        ids=["base2", "base3", "base10", "base62", "base255"],
+    )
+    def test_numeric_bases_match_reference(self, implementation, alphabet):
+        """Every base should convert like plain divmod, at short and long sizes."""
+        import random
+
+        impl, impl_name = implementation
+        encoder = impl.init(alphabet=alphabet)
+        rng = random.Random(len(alphabet))
+
+        for size in [1, 3, 4, 5, 7, 8, 9, 31, 32, 33, 200, 700]:
+            data = b"\x00\x01" + rng.randbytes(size)
+            expected = _reference_encode(data, alphabet)
+
+            assert encoder.encode(data) == expected, f"{impl_name}: size {size}"
+            assert encoder.decode(expected) == data, f"{impl_name}: size {size}"
+
     def test_max_encoded_length_base64(self, implementation):
         """Test max_encoded_length calculation for base64."""
         impl, impl_name = implementation
@@ -367,6 +574,49 @@ class TestEdgeCases:
         )
 
 
+class TestEncodeBatch:
+    """Test BaseXEncoder.encode_batch() against per-item encode()."""
+
+    @pytest.mark.parametrize(
+        "alphabet,mode",
+        [
+            (BASE64_ALPHABET, "RFC4648"),
+            (BASE32_ALPHABET, "RFC4648"),
+            (BASE16_ALPHABET, "RFC4648"),
+            ("01234567", "RFC4648"),
+            (BASE58_ALPHABET, "DEFAULT"),
+        ],
+    )
+    def test_batch_matches_encode(self, implementation, alphabet, mode):
+        """Batch results should match encoding each input separately."""
+        import random
+
+        impl, impl_name = implementation
+        mode_enum = impl.Mode.RFC4648 if mode == "RFC4648" else impl.Mode.DEFAULT
+        encoder = impl.init(alphabet=alphabet, mode=mode_enum)
+
+        rng = random.Random(20)
+        datas = [rng.randbytes(length) for length in range(20)]
+        datas += ["foo", "", b"\x00\x00test"]
+
+        expected = [encoder.encode(data) for data in datas]
+        assert encoder.encode_batch(datas) == expected, f"{impl_name}: {mode}"
+
+    def test_batch_empty(self, implementation):
+        """Empty batches and batches of empty inputs should work."""
+        impl, impl_name = implementation
+        b64 = impl.init(alphabet=BASE64_ALPHABET, mode=impl.Mode.RFC4648)
+        assert b64.encode_batch([]) == []
+        assert b64.encode_batch([b"", ""]) == ["", ""]
+
+    def test_batch_invalid_type(self, implementation):
+        """Non str/bytes items should raise TypeError."""
+        impl, impl_name = implementation
+        b64 = impl.init(alphabet=BASE64_ALPHABET, mode=impl.Mode.RFC4648)
+        with pytest.raises(TypeError, match="Data must be str or bytes"):
+            b64.encode_batch([b"foo", 123])
+
+
 class TestPresets:
     """Test preset instances (basex.b64, basex.b58, etc.)."""
 
@@ -376,6 +626,24 @@ class TestPresets:
         assert impl.b64.encode("foo") == "Zm9v"
         assert impl.b64.decode("Zm9v") == b"foo"
 
+    @pytest.mark.parametrize("length", [255, 256, 1000, 4097])
+    def test_b64_large_matches_stdlib(self, implementation, length):
+        """Large base64 inputs may go through a native codec; results must not change."""
+        import base64
+        import random
+
+        impl, impl_name = implementation
+        b64 = impl.init(alphabet=BASE64_ALPHABET, mode=impl.Mode.RFC4648)
+        data = random.Random(length).randbytes(length)
+        expected = base64.b64encode(data).decode("ascii")
+
+        assert b64.encode(data) == expected
+        assert b64.decode(expected) == data
+        # Unpadded input is rejected by the native codecs but accepted here
+        assert b64.decode(expected.rstrip("=")) == data
+        with pytest.raises(ValueError):
+            b64.decode(expected[:100] + "!" + expected[100:])
+
     def test_b32_preset(self, implementation):
         """Test basex.b32 preset."""
         impl, impl_name = implementation
@@ -441,6 +709,12 @@ class TestValidations:
         with pytest.raises(TypeError, match="(Alphabet must be str|incorrect type)"):
             impl.init(alphabet=None)
 
+    def test_rfc4648_non_power_of_two_alphabet(self, implementation):
+        """RFC4648 mode should reject non-power-of-2 alphabets at init."""
+        impl, impl_name = implementation
+        with pytest.raises(ValueError, match="power-of-2"):
+            impl.init(alphabet=BASE58_ALPHABET, mode=impl.Mode.RFC4648)
+
     # Data type validations for encode
     def test_encode_invalid_type_int(self, implementation):
         """encode() with int should raise TypeError."""
@@ -501,3 +775,13 @@ class TestValidations:
         encoded = encoder.encode("hello")
         decoded = encoder.decode(encoded)
         assert decoded == b"hello"
+
+    def test_unicode_alphabet_leading_zeros(self, implementation):
+        """Runs of zero bytes should map to runs of the first Unicode symbol."""
+        impl, impl_name = implementation
+        encoder = impl.init(alphabet="абвгдежзий")
+        for data in [b"\x00\x01", b"\x00" * 40 + b"hello", b"hello"]:
+            encoded = encoder.encode(data)
+            zeros = len(data) - len(data.lstrip(b"\x00"))
+            assert encoded[:zeros] == "а" * zeros, impl_name
+            assert encoder.decode(encoded) == data, impl_name
@@ -6,7 +6,7 @@ def test_implementation_detection():
     import basex
 
     assert hasattr(basex, "_implementation")
-    assert basex._implementation in ("cython", "python")
+    assert basex._implementation in ("cython", "numba", "python")
 
 
 def test_forced_python_fallback():
@@ -143,6 +143,9 @@ def test_presets_use_cython_when_available():
         assert basex.b58.__class__.__module__ == "basex._basex"
         assert basex.b57.__class__.__module__ == "basex._basex"
         assert basex.b56.__class__.__module__ == "basex._basex"
+    elif basex._implementation == "numba":
+        assert basex.b64.__class__.__module__ == "basex._numba_impl"
+        assert basex.b58.__class__.__module__ == "basex._numba_impl"
     else:
         # When Cython is not available, presets should use Python BaseXEncoder
         assert basex.b64.__class__.__module__ == "basex.basex"
@@ -151,3 +154,54 @@ def test_presets_use_cython_when_available():
         assert basex.b58.__class__.__module__ == "basex.basex"
         assert basex.b57.__class__.__module__ == "basex.basex"
         assert basex.b56.__class__.__module__ == "basex.basex"
+
+
+def test_init_returns_presets():
+    """init() with a preset's alphabet and mode returns the preset itself."""
+    import basex
+    from basex.constants import BASE58_ALPHABET, BASE64_ALPHABET
+
+    assert basex.init(BASE64_ALPHABET, basex.Mode.RFC4648) is basex.b64
+    assert basex.init(alphabet=BASE58_ALPHABET) is basex.b58
+
+
+def test_short_input_cache(monkeypatch):
+    """Cached preset encoding should match the uncached encoder.
+
+    Without compiled backends exactly the numeric presets are wrapped.
+    """
+    import importlib.util
+    import sys
+
+    import basex.presets
+    from basex import basex as py_impl
+    from basex.basex import BaseXEncoder
+    from basex.constants import BASE58_ALPHABET
+    from basex.presets import _cache_short_inputs
+
+    reference = BaseXEncoder(BASE58_ALPHABET)
+    encoder = _cache_short_inputs(BaseXEncoder(BASE58_ALPHABET))
+
+    for data in ["foo", b"foo", b"\x00\x01", "x" * 40, bytearray(b"foo")]:
+        assert encoder.encode(data) == reference.encode(data)
+        assert encoder.encode(data) == reference.encode(data)
+    assert encoder.encode_batch([b"foo", "foo"]) == [reference.encode(b"foo")] * 2
+
+    monkeypatch.setitem(sys.modules, "basex._basex", None)
+    monkeypatch.setitem(sys.modules, "basex._numba_impl", None)
+    # Fresh encoders, so the patched ones do not leak into other tests
+    py_impl._cached_encoder.cache_clear()
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "basex_fallback_presets", basex.presets.__file__
+        )
+        presets = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(presets)
+
+        wrapped = {
+            name for name in presets.__all__ if "encode" in vars(getattr(presets, name))
+        }
+        assert not presets._COMPILED
+        assert wrapped == {"b58", "b57", "b56"}
+    finally:
+        py_impl._cached_encoder.cache_clear()